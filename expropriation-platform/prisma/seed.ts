@@ -135,8 +135,11 @@ async function main() {
     },
   });
 
-  // Create users
-  const hashedPassword = await bcrypt.hash('admin123', 12);
+  // Create users. Seed data is development tooling, so a low bcrypt
+  // cost is used outside production; the hash is computed once and
+  // shared by every seeded account
+  const saltRounds = process.env.NODE_ENV === 'production' ? 12 : 4;
+  const hashedPassword = await bcrypt.hash('admin123', saltRounds);
 
   const superAdmin = await prisma.user.upsert({
     where: { email: 'admin@mopc.gob.do' },
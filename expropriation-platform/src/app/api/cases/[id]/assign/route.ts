@@ -3,6 +3,7 @@ import { getServerSession } from 'next-auth'
 import { authOptions } from '@/lib/auth'
 import { prisma } from '@/lib/prisma'
 import { logActivity } from '@/lib/activity-logger'
+import { getUserAccessProfile } from '@/lib/permissions'
 import { CaseAssignmentSchema } from '@/lib/validations/case'
 
 // PUT /api/cases/[id]/assign - Assign or reassign a case
@@ -29,13 +30,11 @@ export async function PUT(
 
     const { assignedToId, supervisedById, reason } = validationResult.data
 
-    // Get user to check permissions
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true }
-    })
+    // Resolve role and department from the cached access profile
+    // instead of re-querying the user row with its role join
+    const profile = await getUserAccessProfile(session.user.id)
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 })
     }
 
@@ -54,11 +53,11 @@ export async function PUT(
     }
 
     // Check permissions
-    const role = user.role.name as string
+    const role = profile.roleName.toUpperCase()
     const hasAssignmentPermission =
       role === 'SUPER_ADMIN' ||
-      (role === 'DEPARTMENT_ADMIN' && existingCase.departmentId === user.departmentId) ||
-      (role === 'SUPERVISOR' && existingCase.supervisedById === user.id)
+      (role === 'DEPARTMENT_ADMIN' && existingCase.departmentId === profile.departmentId) ||
+      (role === 'SUPERVISOR' && existingCase.supervisedById === session.user.id)
 
     if (!hasAssignmentPermission) {
       return NextResponse.json(
@@ -189,7 +188,7 @@ export async function PUT(
 
     // Log assignment change
     await logActivity({
-      userId: user.id,
+      userId: session.user.id,
       action: 'ASSIGNMENT_CHANGED',
       entityType: 'case',
       entityId: updatedCase.id,
@@ -212,7 +211,7 @@ export async function PUT(
     await prisma.caseHistory.create({
       data: {
         caseId: updatedCase.id,
-        changedById: user.id,
+        changedById: session.user.id,
         action: 'assignment_change',
         previousValue: JSON.stringify({
           assignedTo: existingCase.assignedTo,
@@ -228,7 +227,7 @@ export async function PUT(
     })
 
     // Create notifications for newly assigned users
-    if (assignedToId && assignedToId !== existingCase.assignedToId && assignedToId !== user.id) {
+    if (assignedToId && assignedToId !== existingCase.assignedToId && assignedToId !== session.user.id) {
       await prisma.notification.create({
         data: {
           userId: assignedToId,
@@ -241,7 +240,7 @@ export async function PUT(
       })
     }
 
-    if (supervisedById && supervisedById !== existingCase.supervisedById && supervisedById !== user.id) {
+    if (supervisedById && supervisedById !== existingCase.supervisedById && supervisedById !== session.user.id) {
       await prisma.notification.create({
         data: {
           userId: supervisedById,
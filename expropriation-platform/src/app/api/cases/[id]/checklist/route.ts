@@ -2,8 +2,14 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth/next';
 import { authOptions } from '@/app/api/auth/[...nextauth]/route';
 import { prisma } from '@/lib/prisma';
+import { getUserAccessProfile } from '@/lib/permissions';
 import { z } from 'zod';
 
+// Role sets for permission checks, hoisted to module scope so each
+// request tests membership instead of rebuilding comparison chains
+const ADMIN_ROLES = new Set(['super_admin', 'department_admin']);
+const CASE_MANAGER_ROLES = new Set(['super_admin', 'department_admin', 'supervisor']);
+
 const checklistItemSchema = z.object({
   title: z.string().min(1, 'El título es requerido'),
   description: z.string().optional(),
@@ -65,20 +71,18 @@ export async function GET(
     }
 
     // Get user permissions
-    const user = await prisma.user.findUnique({
-      where: { email: session.user?.email as string },
-      include: { role: true }
-    });
+    // Cached access profile avoids a user+role join per permission check
+    const profile = await getUserAccessProfile(session.user.id);
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 });
     }
 
     // Check access permissions
-    const hasAccess = user.role.name === 'super_admin' ||
-                     caseData.departmentId === user.departmentId ||
-                     caseData.assignedToId === user.id ||
-                     caseData.supervisedById === user.id;
+    const hasAccess = profile.roleName === 'super_admin' ||
+                     caseData.departmentId === profile.departmentId ||
+                     caseData.assignedToId === session.user.id ||
+                     caseData.supervisedById === session.user.id;
 
     if (!hasAccess) {
       return NextResponse.json({ error: 'Forbidden' }, { status: 403 });
@@ -171,7 +175,7 @@ export async function POST(
     const validatedData = checklistItemSchema.parse(body);
 
     // Get case data and user
-    const [caseData, user] = await Promise.all([
+    const [caseData, profile] = await Promise.all([
       prisma.case.findUnique({
         where: { id: caseId },
         select: {
@@ -179,23 +183,19 @@ export async function POST(
           departmentId: true
         }
       }),
-      prisma.user.findUnique({
-        where: { email: session.user?.email as string },
-        include: { role: true }
-      })
+      getUserAccessProfile(session.user.id)
     ]);
 
     if (!caseData) {
       return NextResponse.json({ error: 'Case not found' }, { status: 404 });
     }
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 });
     }
 
     // Check permissions (only admins can add checklist items)
-    const hasPermission = user.role.name === 'super_admin' ||
-                         user.role.name === 'department_admin';
+    const hasPermission = ADMIN_ROLES.has(profile.roleName);
 
     if (!hasPermission) {
       return NextResponse.json({ error: 'Forbidden' }, { status: 403 });
@@ -217,7 +217,7 @@ export async function POST(
     // Log activity
     await prisma.activity.create({
       data: {
-        userId: user.id,
+        userId: session.user.id,
         action: 'CREATED',
         entityType: 'checklist_item',
         entityId: checklistItem.id,
@@ -270,7 +270,7 @@ export async function PUT(
     const validatedData = checklistCompletionSchema.parse(body);
 
     // Get case data and user
-    const [caseData, user] = await Promise.all([
+    const [caseData, profile] = await Promise.all([
       prisma.case.findUnique({
         where: { id: caseId },
         include: {
@@ -282,25 +282,20 @@ export async function PUT(
           }
         }
       }),
-      prisma.user.findUnique({
-        where: { email: session.user?.email as string },
-        include: { role: true }
-      })
+      getUserAccessProfile(session.user.id)
     ]);
 
     if (!caseData) {
       return NextResponse.json({ error: 'Case not found' }, { status: 404 });
     }
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 });
     }
 
     // Check permissions
-    const hasPermission = user.role.name === 'super_admin' ||
-                         user.role.name === 'department_admin' ||
-                         user.role.name === 'supervisor' ||
-                         (user.role.name === 'analyst' && caseData.assignedToId === user.id);
+    const hasPermission = CASE_MANAGER_ROLES.has(profile.roleName) ||
+                         (profile.roleName === 'analyst' && caseData.assignedToId === session.user.id);
 
     if (!hasPermission) {
       return NextResponse.json({ error: 'Forbidden' }, { status: 403 });
@@ -338,7 +333,7 @@ export async function PUT(
         data: {
           isCompleted: validatedData.isCompleted,
           completedAt: validatedData.isCompleted ? new Date() : null,
-          completedBy: validatedData.isCompleted ? user.id : null,
+          completedBy: validatedData.isCompleted ? session.user.id : null,
           notes: validatedData.notes,
           attachmentPath: validatedData.attachmentPath
         }
@@ -350,7 +345,7 @@ export async function PUT(
           checklistId: validatedData.checklistId,
           isCompleted: validatedData.isCompleted,
           completedAt: validatedData.isCompleted ? new Date() : null,
-          completedBy: validatedData.isCompleted ? user.id : null,
+          completedBy: validatedData.isCompleted ? session.user.id : null,
           notes: validatedData.notes,
           attachmentPath: validatedData.attachmentPath
         }
@@ -360,7 +355,7 @@ export async function PUT(
     // Log activity
     await prisma.activity.create({
       data: {
-        userId: user.id,
+        userId: session.user.id,
         action: validatedData.isCompleted ? 'UPDATED' : 'UPDATED',
         entityType: 'checklist_completion',
         entityId: completion.id,
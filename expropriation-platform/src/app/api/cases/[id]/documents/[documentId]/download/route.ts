@@ -2,10 +2,17 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
+import { hasDepartmentAccess } from '@/lib/permissions';
 import path from 'path';
 import fs from 'fs/promises';
+import { createReadStream } from 'fs';
+import { Readable } from 'stream';
 import crypto from 'crypto';
 
+// Files are streamed to the client in fixed-size chunks so memory
+// stays O(chunk) instead of O(filesize) per concurrent download
+const DOWNLOAD_CHUNK_BYTES = 1024 * 1024;
+
 // GET /api/cases/[id]/documents/[documentId]/download - Download document
 export async function GET(
   request: NextRequest,
@@ -111,17 +118,21 @@ export async function GET(
 
     // Get file stats
     const stats = await fs.stat(filePath);
-    let fileBuffer = await fs.readFile(filePath);
     let fileName = document.originalFileName || document.fileName;
     let mimeType = document.mimeType;
+    let fileSize = stats.size;
 
-    // Handle different formats
+    // Handle different formats. Conversion needs the whole file in
+    // memory; the original-format path streams from disk instead
+    let convertedBuffer: Buffer | null = null;
     if (format !== 'original') {
       try {
+        const fileBuffer = await fs.readFile(filePath);
         const convertedData = await convertDocumentFormat(fileBuffer, document.mimeType, format);
-        fileBuffer = convertedData.buffer;
+        convertedBuffer = convertedData.buffer;
         mimeType = convertedData.mimeType;
         fileName = `${path.parse(fileName).name}.${format}`;
+        fileSize = convertedBuffer.length;
       } catch (error) {
         console.error('Format conversion error:', error);
         // Fall back to original format if conversion fails
@@ -139,7 +150,7 @@ export async function GET(
         action: 'DOWNLOADED',
         description: `Document downloaded${version ? ` (version ${version})` : ''} in ${format} format`,
         userId: session.user.id,
-        fileSize: fileBuffer.length,
+        fileSize,
         fileName: fileName,
         metadata: {
           downloadTimestamp: new Date().toISOString(),
@@ -164,12 +175,19 @@ export async function GET(
       });
     }
 
-    // Return file as download
-    return new NextResponse(fileBuffer, {
+    // Return file as download, streaming from disk unless a format
+    // conversion already materialized the bytes
+    const body =
+      convertedBuffer ??
+      (Readable.toWeb(
+        createReadStream(filePath, { highWaterMark: DOWNLOAD_CHUNK_BYTES })
+      ) as ReadableStream);
+
+    return new NextResponse(body, {
       headers: {
         'Content-Type': mimeType,
         'Content-Disposition': `attachment; filename="${encodeURIComponent(fileName)}"`,
-        'Content-Length': fileBuffer.length.toString(),
+        'Content-Length': fileSize.toString(),
         'Cache-Control': 'no-cache, no-store, must-revalidate',
         'Pragma': 'no-cache',
         'Expires': '0',
@@ -230,23 +248,3 @@ async function convertDocumentFormat(
   }
 }
 
-async function hasDepartmentAccess(userId: string, departmentId: string): Promise<boolean> {
-  const user = await prisma.user.findUnique({
-    where: { id: userId },
-    select: {
-      departmentId: true,
-      role: {
-        select: { permissions: true }
-      }
-    },
-  });
-
-  if (!user) return false;
-
-  const sameDepartment = user.departmentId === departmentId;
-  const hasAdminAccess = user.role?.permissions?.admin ||
-                        user.role?.permissions?.allDepartments ||
-                        user.role?.permissions?.viewAllCases;
-
-  return sameDepartment || hasAdminAccess;
-}
\ No newline at end of file
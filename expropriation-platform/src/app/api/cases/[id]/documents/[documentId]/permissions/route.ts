@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
+import { hasDepartmentAccess } from '@/lib/permissions';
 import { z } from 'zod';
 
 // Validation schemas
@@ -637,23 +638,3 @@ async function getUserEffectivePermission(
   };
 }
 
-async function hasDepartmentAccess(userId: string, departmentId: string): Promise<boolean> {
-  const user = await prisma.user.findUnique({
-    where: { id: userId },
-    select: {
-      departmentId: true,
-      role: {
-        select: { permissions: true }
-      }
-    },
-  });
-
-  if (!user) return false;
-
-  const sameDepartment = user.departmentId === departmentId;
-  const hasAdminAccess = user.role?.permissions?.admin ||
-                        user.role?.permissions?.allDepartments ||
-                        user.role?.permissions?.viewAllCases;
-
-  return sameDepartment || hasAdminAccess;
-}
\ No newline at end of file
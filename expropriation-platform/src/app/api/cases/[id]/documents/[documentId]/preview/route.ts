@@ -2,8 +2,15 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
+import { hasDepartmentAccess } from '@/lib/permissions';
 import path from 'path';
 import fs from 'fs/promises';
+import { createReadStream } from 'fs';
+import { Readable } from 'stream';
+
+// Previews are streamed from disk in fixed-size chunks so memory
+// stays O(chunk) instead of O(filesize) per concurrent request
+const PREVIEW_CHUNK_BYTES = 1024 * 1024;
 
 // GET /api/cases/[id]/documents/[documentId]/preview - Preview document
 export async function GET(
@@ -112,7 +119,6 @@ export async function GET(
 
     // Get file stats
     const stats = await fs.stat(filePath);
-    const fileBuffer = await fs.readFile(filePath);
 
     // Log preview access
     await prisma.documentHistory.create({
@@ -156,12 +162,54 @@ export async function GET(
     ].includes(mimeType);
 
     if (isPreviewable) {
-      // Return file for inline preview
-      return new NextResponse(fileBuffer, {
+      // PDF viewers and media players fetch byte ranges while the user
+      // scrolls; honoring Range keeps each request to the bytes the
+      // viewer needs instead of re-transmitting the whole file
+      const rangeHeader = request.headers.get('range');
+      const rangeMatch = rangeHeader?.match(/^bytes=(\d*)-(\d*)$/);
+      if (rangeMatch && (rangeMatch[1] || rangeMatch[2])) {
+        const start = rangeMatch[1]
+          ? parseInt(rangeMatch[1])
+          : Math.max(0, stats.size - parseInt(rangeMatch[2]));
+        const end = rangeMatch[1] && rangeMatch[2]
+          ? Math.min(parseInt(rangeMatch[2]), stats.size - 1)
+          : stats.size - 1;
+
+        if (start > end || start >= stats.size) {
+          return new NextResponse(null, {
+            status: 416,
+            headers: { 'Content-Range': `bytes */${stats.size}` },
+          });
+        }
+
+        const rangeStream = createReadStream(filePath, {
+          start,
+          end,
+          highWaterMark: PREVIEW_CHUNK_BYTES,
+        });
+        return new NextResponse(Readable.toWeb(rangeStream) as ReadableStream, {
+          status: 206,
+          headers: {
+            'Content-Type': mimeType,
+            'Content-Disposition': `inline; filename="${document.fileName}"`,
+            'Content-Range': `bytes ${start}-${end}/${stats.size}`,
+            'Content-Length': (end - start + 1).toString(),
+            'Accept-Ranges': 'bytes',
+            'Cache-Control': 'public, max-age=3600', // Cache for 1 hour
+          },
+        });
+      }
+
+      // Return file for inline preview, streamed from disk
+      const fileStream = createReadStream(filePath, {
+        highWaterMark: PREVIEW_CHUNK_BYTES,
+      });
+      return new NextResponse(Readable.toWeb(fileStream) as ReadableStream, {
         headers: {
           'Content-Type': mimeType,
           'Content-Disposition': `inline; filename="${document.fileName}"`,
           'Content-Length': stats.size.toString(),
+          'Accept-Ranges': 'bytes',
           'Cache-Control': 'public, max-age=3600', // Cache for 1 hour
         },
       });
@@ -185,23 +233,3 @@ export async function GET(
   }
 }
 
-async function hasDepartmentAccess(userId: string, departmentId: string): Promise<boolean> {
-  const user = await prisma.user.findUnique({
-    where: { id: userId },
-    select: {
-      departmentId: true,
-      role: {
-        select: { permissions: true }
-      }
-    },
-  });
-
-  if (!user) return false;
-
-  const sameDepartment = user.departmentId === departmentId;
-  const hasAdminAccess = user.role?.permissions?.admin ||
-                        user.role?.permissions?.allDepartments ||
-                        user.role?.permissions?.viewAllCases;
-
-  return sameDepartment || hasAdminAccess;
-}
\ No newline at end of file
@@ -2,10 +2,12 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
+import { hasDepartmentAccess } from '@/lib/permissions';
 import { z } from 'zod';
 import crypto from 'crypto';
 import path from 'path';
 import fs from 'fs/promises';
+import { hashStreamToFile } from '@/lib/file-hash';
 
 // Validation schemas
 const createVersionSchema = z.object({
@@ -277,13 +279,9 @@ export async function POST(
       });
     }
 
-    // Update previous version to not be latest
-    await prisma.document.updateMany({
-      where: { id: documentId },
-      data: { isLatest: false },
-    });
-
-    // Update main document record
+    // Update main document record. isLatest is set directly below, so
+    // no separate UPDATE to clear it first; metadata-only versions
+    // reuse the stored fileHash and never touch the file bytes
     const updatedDocument = await prisma.document.update({
       where: { id: documentId },
       data: {
@@ -393,12 +391,9 @@ async function createDocumentVersion({
   const fileName = `v${versionNumber}-${timestamp}-${random}-${name}${ext}`;
   const filePath = path.join(UPLOAD_DIR, fileName);
 
-  // Save file to disk
-  const buffer = Buffer.from(await file.arrayBuffer());
-  await fs.writeFile(filePath, buffer);
-
-  // Calculate file hash
-  const fileHash = crypto.createHash('sha256').update(buffer).digest('hex');
+  // Save file to disk, hashing the bytes in the same pass so the
+  // upload is neither buffered whole in memory nor read twice
+  const fileHash = await hashStreamToFile(file.stream(), filePath);
 
   // Create document version record
   const version = await prisma.documentVersion.create({
@@ -452,26 +447,6 @@ async function createDocumentVersion({
 }
 
 // Helper functions
-async function hasDepartmentAccess(userId: string, departmentId: string): Promise<boolean> {
-  const user = await prisma.user.findUnique({
-    where: { id: userId },
-    select: {
-      departmentId: true,
-      role: {
-        select: { permissions: true }
-      }
-    },
-  });
-
-  if (!user) return false;
-
-  const sameDepartment = user.departmentId === departmentId;
-  const hasAdminAccess = user.role?.permissions?.admin ||
-                        user.role?.permissions?.allDepartments ||
-                        user.role?.permissions?.viewAllCases;
-
-  return sameDepartment || hasAdminAccess;
-}
 
 function formatFileSize(bytes: number): string {
   if (bytes === 0) return '0 Bytes';
@@ -3,6 +3,7 @@ import { getServerSession } from 'next-auth'
 import { authOptions } from '@/lib/auth'
 import { prisma } from '@/lib/prisma'
 import { logActivity } from '@/lib/activity-logger'
+import { getUserAccessProfile } from '@/lib/permissions'
 import { z } from 'zod'
 
 const LinkDocumentSchema = z.object({
@@ -24,13 +25,11 @@ export async function POST(
     const body = await request.json()
     const { documentId } = LinkDocumentSchema.parse(body)
 
-    // Get user to check permissions
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true }
-    })
+    // Resolve role and department from the cached access profile
+    // instead of re-querying the user row with its role join
+    const profile = await getUserAccessProfile(session.user.id)
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 })
     }
 
@@ -45,8 +44,8 @@ export async function POST(
     }
 
     // Check department-based access control
-    const role = user.role.name as string
-    if (role !== 'SUPER_ADMIN' && existingCase.departmentId !== user.departmentId) {
+    const role = profile.roleName.toUpperCase()
+    if (role !== 'SUPER_ADMIN' && existingCase.departmentId !== profile.departmentId) {
       return NextResponse.json(
         { error: 'You can only link documents to cases in your department' },
         { status: 403 }
@@ -90,7 +89,7 @@ export async function POST(
 
     // Log activity
     await logActivity({
-      userId: user.id,
+      userId: session.user.id,
       action: 'LINKED',
       entityType: 'document',
       entityId: updatedDocument.id,
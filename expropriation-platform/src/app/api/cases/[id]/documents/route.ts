@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
+import { hasDepartmentAccess } from '@/lib/permissions';
 import { z } from 'zod';
 import { DocumentFormData } from '@/types/client';
 
@@ -311,26 +312,6 @@ export async function POST(
 }
 
 // Helper functions
-async function hasDepartmentAccess(userId: string, departmentId: string): Promise<boolean> {
-  const user = await prisma.user.findUnique({
-    where: { id: userId },
-    select: {
-      departmentId: true,
-      role: {
-        select: { name: true }
-      }
-    },
-  });
-
-  if (!user) return false;
-
-  // Check if user is in the same department or has admin permissions
-  const sameDepartment = user.departmentId === departmentId;
-  const hasAdminAccess = user.role?.name === 'super_admin' ||
-                        user.role?.name === 'department_admin';
-
-  return sameDepartment || hasAdminAccess;
-}
 
 function formatFileSize(bytes: number): string {
   if (bytes === 0) return '0 Bytes';
@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
+import { hasDepartmentAccess } from '@/lib/permissions';
 import { z } from 'zod';
 
 // Define document templates for different stages and document types
@@ -203,7 +204,9 @@ export async function GET(
     const { searchParams } = new URL(request.url);
     const documentType = searchParams.get('documentType');
 
-    // Verify case exists and user has access
+    // Verify case exists and user has access. The select also carries
+    // the owner/property columns and department name the template
+    // placeholders need, so one narrow query serves the whole handler
     const case_ = await prisma.case.findUnique({
       where: { id: caseId },
       select: {
@@ -214,6 +217,15 @@ export async function GET(
         createdById: true,
         assignedToId: true,
         supervisedById: true,
+        ownerName: true,
+        ownerAddress: true,
+        propertyAddress: true,
+        propertyCity: true,
+        propertyProvince: true,
+        propertyArea: true,
+        department: {
+          select: { name: true },
+        },
       },
     });
 
@@ -254,26 +266,18 @@ export async function GET(
       );
     }
 
-    // Get case-specific data for placeholder filling
-    const caseData = await prisma.case.findUnique({
-      where: { id: caseId },
-      include: {
-        department: true,
-        createdBy: true,
-        assignedTo: true,
-      },
-    });
-
-    // Prepare case data for template placeholders
+    // Prepare case data for template placeholders from the row already
+    // fetched above; this used to re-query the case with full
+    // department/createdBy/assignedTo rows joined in
     const caseContext = {
-      NUMERO_EXPEDIENTE: case_?.fileNumber || '',
-      PROPIETARIO_NOMBRE: caseData?.ownerName || '',
-      PROPIETARIO_DIRECCION: caseData?.ownerAddress || '',
-      PROPIEDAD_DIRECCION: caseData?.propertyAddress || '',
-      PROPIEDAD_CIUDAD: caseData?.propertyCity || '',
-      PROPIEDAD_PROVINCIA: caseData?.propertyProvince || '',
-      AREA: caseData?.propertyArea?.toString() || '',
-      INSTITUCION: caseData?.department?.name || '',
+      NUMERO_EXPEDIENTE: case_.fileNumber || '',
+      PROPIETARIO_NOMBRE: case_.ownerName || '',
+      PROPIETARIO_DIRECCION: case_.ownerAddress || '',
+      PROPIEDAD_DIRECCION: case_.propertyAddress || '',
+      PROPIEDAD_CIUDAD: case_.propertyCity || '',
+      PROPIEDAD_PROVINCIA: case_.propertyProvince || '',
+      AREA: case_.propertyArea?.toString() || '',
+      INSTITUCION: case_.department?.name || '',
     };
 
     return NextResponse.json({
@@ -474,24 +478,3 @@ export async function POST(
   }
 }
 
-async function hasDepartmentAccess(userId: string, departmentId: string): Promise<boolean> {
-  const user = await prisma.user.findUnique({
-    where: { id: userId },
-    select: {
-      departmentId: true,
-      role: {
-        select: { permissions: true }
-      }
-    },
-  });
-
-  if (!user) return false;
-
-  const sameDepartment = user.departmentId === departmentId;
-  const permissions = user.role?.permissions as any;
-  const hasAdminAccess = permissions?.admin ||
-                        permissions?.allDepartments ||
-                        permissions?.viewAllCases;
-
-  return sameDepartment || hasAdminAccess;
-}
\ No newline at end of file
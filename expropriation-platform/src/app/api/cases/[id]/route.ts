@@ -3,6 +3,7 @@ import { getServerSession } from 'next-auth'
 import { authOptions } from '@/lib/auth'
 import { prisma } from '@/lib/prisma'
 import { logActivity } from '@/lib/activity-logger'
+import { getUserAccessProfile } from '@/lib/permissions'
 import { UpdateCaseSchema, CaseStatusUpdateSchema, CaseStageUpdateSchema, CaseAssignmentSchema } from '@/lib/validations/case'
 
 // GET /api/cases/[id] - Get a specific case
@@ -18,13 +19,10 @@ export async function GET(
 
     const { id: caseId } = await params
 
-    // Get user to check permissions
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true }
-    })
+    // Get the cached access profile to check permissions
+    const profile = await getUserAccessProfile(session.user.id)
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 })
     }
 
@@ -142,13 +140,13 @@ export async function GET(
     }
 
     // Check access permissions
-    const role = user.role.name as string
+    const role = profile.roleName.toUpperCase()
     const hasAccess =
       role === 'SUPER_ADMIN' ||
-      caseRecord.departmentId === user.departmentId ||
-      caseRecord.createdById === user.id ||
-      caseRecord.assignedToId === user.id ||
-      caseRecord.supervisedById === user.id
+      caseRecord.departmentId === profile.departmentId ||
+      caseRecord.createdById === session.user.id ||
+      caseRecord.assignedToId === session.user.id ||
+      caseRecord.supervisedById === session.user.id
 
     if (!hasAccess) {
       return NextResponse.json({ error: 'Access denied' }, { status: 403 })
@@ -156,7 +154,7 @@ export async function GET(
 
     // Log case view
     await logActivity({
-      userId: user.id,
+      userId: session.user.id,
       action: 'VIEWED',
       entityType: 'case',
       entityId: caseRecord.id,
@@ -201,13 +199,10 @@ export async function PUT(
 
     const updateData = validationResult.data
 
-    // Get user to check permissions
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true }
-    })
+    // Get the cached access profile to check permissions
+    const profile = await getUserAccessProfile(session.user.id)
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 })
     }
 
@@ -226,13 +221,13 @@ export async function PUT(
     }
 
     // Check permissions
-    const role = user.role.name as string
+    const role = profile.roleName.toUpperCase()
     const hasUpdatePermission =
       role === 'SUPER_ADMIN' ||
-      (role === 'DEPARTMENT_ADMIN' && existingCase.departmentId === user.departmentId) ||
-      (role === 'SUPERVISOR' && existingCase.supervisedById === user.id) ||
-      (role === 'ANALYST' && existingCase.assignedToId === user.id) ||
-      existingCase.createdById === user.id
+      (role === 'DEPARTMENT_ADMIN' && existingCase.departmentId === profile.departmentId) ||
+      (role === 'SUPERVISOR' && existingCase.supervisedById === session.user.id) ||
+      (role === 'ANALYST' && existingCase.assignedToId === session.user.id) ||
+      existingCase.createdById === session.user.id
 
     if (!hasUpdatePermission) {
       return NextResponse.json(
@@ -343,7 +338,7 @@ export async function PUT(
 
     // Log case update
     await logActivity({
-      userId: user.id,
+      userId: session.user.id,
       action: 'UPDATED',
       entityType: 'case',
       entityId: updatedCase.id,
@@ -360,7 +355,7 @@ export async function PUT(
       await prisma.caseHistory.create({
         data: {
           caseId: updatedCase.id,
-          changedById: user.id,
+          changedById: session.user.id,
           action: 'field_update',
           field,
           previousValue: JSON.stringify(change.from),
@@ -393,13 +388,10 @@ export async function DELETE(
 
     const { id: caseId } = await params
 
-    // Get user to check permissions
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true }
-    })
+    // Get the cached access profile to check permissions
+    const profile = await getUserAccessProfile(session.user.id)
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 })
     }
 
@@ -413,7 +405,7 @@ export async function DELETE(
     }
 
     // Check permissions (only admins can delete cases)
-    const role = user.role.name as string
+    const role = profile.roleName.toUpperCase()
     if (!['SUPER_ADMIN', 'DEPARTMENT_ADMIN'].includes(role)) {
       return NextResponse.json(
         { error: 'Insufficient permissions to delete cases' },
@@ -421,7 +413,7 @@ export async function DELETE(
       )
     }
 
-    if (role === 'DEPARTMENT_ADMIN' && existingCase.departmentId !== user.departmentId) {
+    if (role === 'DEPARTMENT_ADMIN' && existingCase.departmentId !== profile.departmentId) {
       return NextResponse.json(
         { error: 'You can only delete cases from your department' },
         { status: 403 }
@@ -433,13 +425,13 @@ export async function DELETE(
       where: { id: caseId },
       data: {
         deletedAt: new Date(),
-        deletedBy: user.id
+        deletedBy: session.user.id
       }
     })
 
     // Log case deletion
     await logActivity({
-      userId: user.id,
+      userId: session.user.id,
       action: 'DELETED',
       entityType: 'case',
       entityId: caseId,
@@ -2,9 +2,13 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth/next';
 import { authOptions } from '@/app/api/auth/[...nextauth]/route';
 import { prisma } from '@/lib/prisma';
+import { getUserAccessProfile } from '@/lib/permissions';
 import { CaseStage } from '@prisma/client';
 import { z } from 'zod';
 
+// Roles allowed to manage stage transitions, hoisted to module scope
+const CASE_MANAGER_ROLES = new Set(['super_admin', 'department_admin', 'supervisor']);
+
 const progressionSchema = z.object({
   toStage: z.nativeEnum(CaseStage),
   reason: z.string().optional(),
@@ -70,18 +74,16 @@ export async function GET(
     }
 
     // Check if user has permission to view this case
-    const user = await prisma.user.findUnique({
-      where: { email: session.user?.email as string },
-      include: { role: true }
-    });
+    // Cached access profile avoids a user+role join per permission check
+    const profile = await getUserAccessProfile(session.user.id);
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 });
     }
 
     // Check department access or admin role
-    const hasAccess = user.role.name === 'super_admin' ||
-                     currentCase.departmentId === user.departmentId;
+    const hasAccess = profile.roleName === 'super_admin' ||
+                     currentCase.departmentId === profile.departmentId;
 
     if (!hasAccess) {
       return NextResponse.json({ error: 'Forbidden' }, { status: 403 });
@@ -153,9 +155,7 @@ export async function POST(
     }
 
     // Check permissions
-    const hasPermission = user.role.name === 'super_admin' ||
-                         user.role.name === 'department_admin' ||
-                         user.role.name === 'supervisor' ||
+    const hasPermission = CASE_MANAGER_ROLES.has(user.role.name) ||
                          (user.role.name === 'analyst' && currentCase.assignedToId === user.id);
 
     if (!hasPermission) {
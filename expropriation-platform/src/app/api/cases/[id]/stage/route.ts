@@ -3,6 +3,7 @@ import { getServerSession } from 'next-auth'
 import { authOptions } from '@/lib/auth'
 import { prisma } from '@/lib/prisma'
 import { logActivity } from '@/lib/activity-logger'
+import { getUserAccessProfile } from '@/lib/permissions'
 import { CaseStageUpdateSchema } from '@/lib/validations/case'
 
 // PUT /api/cases/[id]/stage - Update case stage
@@ -29,13 +30,11 @@ export async function PUT(
 
     const { stage, reason, notes } = validationResult.data
 
-    // Get user to check permissions
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true }
-    })
+    // Resolve role and department from the cached access profile
+    // instead of re-querying the user row with its role join
+    const profile = await getUserAccessProfile(session.user.id)
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 })
     }
 
@@ -54,12 +53,12 @@ export async function PUT(
     }
 
     // Check permissions
-    const role = user.role.name as string
+    const role = profile.roleName.toUpperCase()
     const hasStagePermission =
       role === 'SUPER_ADMIN' ||
-      (role === 'DEPARTMENT_ADMIN' && existingCase.departmentId === user.departmentId) ||
-      (role === 'SUPERVISOR' && existingCase.supervisedById === user.id) ||
-      (role === 'ANALYST' && existingCase.assignedToId === user.id)
+      (role === 'DEPARTMENT_ADMIN' && existingCase.departmentId === profile.departmentId) ||
+      (role === 'SUPERVISOR' && existingCase.supervisedById === session.user.id) ||
+      (role === 'ANALYST' && existingCase.assignedToId === session.user.id)
 
     if (!hasStagePermission) {
       return NextResponse.json(
@@ -173,7 +172,7 @@ export async function PUT(
 
     // Log stage change
     await logActivity({
-      userId: user.id,
+      userId: session.user.id,
       action: 'STAGE_CHANGED',
       entityType: 'case',
       entityId: updatedCase.id,
@@ -192,7 +191,7 @@ export async function PUT(
     await prisma.caseHistory.create({
       data: {
         caseId: updatedCase.id,
-        changedById: user.id,
+        changedById: session.user.id,
         action: 'stage_change',
         previousValue: JSON.stringify({ stage: currentStage }),
         newValue: JSON.stringify({ stage }),
@@ -203,7 +202,7 @@ export async function PUT(
     })
 
     // Create notification for assigned user (if different from current user)
-    if (existingCase.assignedToId && existingCase.assignedToId !== user.id) {
+    if (existingCase.assignedToId && existingCase.assignedToId !== session.user.id) {
       await prisma.notification.create({
         data: {
           userId: existingCase.assignedToId,
@@ -218,7 +217,7 @@ export async function PUT(
 
     // Create notification for supervisor (if different)
     if (existingCase.supervisedById &&
-        existingCase.supervisedById !== user.id &&
+        existingCase.supervisedById !== session.user.id &&
         existingCase.supervisedById !== existingCase.assignedToId) {
       await prisma.notification.create({
         data: {
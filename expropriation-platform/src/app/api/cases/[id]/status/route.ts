@@ -3,6 +3,7 @@ import { getServerSession } from 'next-auth'
 import { authOptions } from '@/lib/auth'
 import { prisma } from '@/lib/prisma'
 import { logActivity } from '@/lib/activity-logger'
+import { getUserAccessProfile } from '@/lib/permissions'
 import { CaseStatusUpdateSchema } from '@/lib/validations/case'
 
 // PUT /api/cases/[id]/status - Update case status
@@ -29,13 +30,11 @@ export async function PUT(
 
     const { status, reason, notes } = validationResult.data
 
-    // Get user to check permissions
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true }
-    })
+    // Resolve role and department from the cached access profile
+    // instead of re-querying the user row with its role join
+    const profile = await getUserAccessProfile(session.user.id)
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 })
     }
 
@@ -54,12 +53,12 @@ export async function PUT(
     }
 
     // Check permissions
-    const role = user.role.name as string
+    const role = profile.roleName.toUpperCase()
     const hasStatusPermission =
       role === 'SUPER_ADMIN' ||
-      (role === 'DEPARTMENT_ADMIN' && existingCase.departmentId === user.departmentId) ||
-      (role === 'SUPERVISOR' && existingCase.supervisedById === user.id) ||
-      (role === 'ANALYST' && existingCase.assignedToId === user.id)
+      (role === 'DEPARTMENT_ADMIN' && existingCase.departmentId === profile.departmentId) ||
+      (role === 'SUPERVISOR' && existingCase.supervisedById === session.user.id) ||
+      (role === 'ANALYST' && existingCase.assignedToId === session.user.id)
 
     if (!hasStatusPermission) {
       return NextResponse.json(
@@ -127,7 +126,7 @@ export async function PUT(
 
     // Log status change
     await logActivity({
-      userId: user.id,
+      userId: session.user.id,
       action: 'STATUS_CHANGED',
       entityType: 'case',
       entityId: updatedCase.id,
@@ -145,7 +144,7 @@ export async function PUT(
     await prisma.caseHistory.create({
       data: {
         caseId: updatedCase.id,
-        changedById: user.id,
+        changedById: session.user.id,
         action: 'status_change',
         previousValue: JSON.stringify({ status: currentStatus }),
         newValue: JSON.stringify({ status }),
@@ -155,7 +154,7 @@ export async function PUT(
     })
 
     // Create notification for assigned user (if different from current user)
-    if (existingCase.assignedToId && existingCase.assignedToId !== user.id) {
+    if (existingCase.assignedToId && existingCase.assignedToId !== session.user.id) {
       await prisma.notification.create({
         data: {
           userId: existingCase.assignedToId,
@@ -170,7 +169,7 @@ export async function PUT(
 
     // Create notification for supervisor (if different from current user and assigned user)
     if (existingCase.supervisedById &&
-        existingCase.supervisedById !== user.id &&
+        existingCase.supervisedById !== session.user.id &&
         existingCase.supervisedById !== existingCase.assignedToId) {
       await prisma.notification.create({
         data: {
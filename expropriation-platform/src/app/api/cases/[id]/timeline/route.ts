@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth/next';
 import { authOptions } from '@/app/api/auth/[...nextauth]/route';
 import { prisma } from '@/lib/prisma';
+import { getUserAccessProfile } from '@/lib/permissions';
 import { CaseStage } from '@prisma/client';
 
 interface TimelineEvent {
@@ -237,20 +238,18 @@ export async function GET(
     }
 
     // Get user permissions
-    const user = await prisma.user.findUnique({
-      where: { email: session.user?.email as string },
-      include: { role: true }
-    });
+    // Cached access profile avoids a user+role join per permission check
+    const profile = await getUserAccessProfile(session.user.id);
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 });
     }
 
     // Check access permissions
-    const hasAccess = user.role.name === 'super_admin' ||
-                     caseData.departmentId === user.departmentId ||
-                     caseData.assignedToId === user.id ||
-                     caseData.supervisedById === user.id;
+    const hasAccess = profile.roleName === 'super_admin' ||
+                     caseData.departmentId === profile.departmentId ||
+                     caseData.assignedToId === session.user.id ||
+                     caseData.supervisedById === session.user.id;
 
     if (!hasAccess) {
       return NextResponse.json({ error: 'Forbidden' }, { status: 403 });
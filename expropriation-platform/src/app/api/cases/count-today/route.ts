@@ -11,18 +11,9 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
 
-    // Get user to check permissions
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true }
-    })
-
-    if (!user) {
-      return NextResponse.json({ error: 'User not found' }, { status: 404 })
-    }
-
-    // Check if user has permission to create cases (required for this functionality)
-    const role = user.role.name.toUpperCase() as string
+    // The session token already carries the role and department, so no
+    // user fetch is needed for this check
+    const role = (session.user.role || '').toUpperCase()
     if (!['SUPER_ADMIN', 'DEPARTMENT_ADMIN', 'ANALYST', 'SUPERVISOR'].includes(role)) {
       return NextResponse.json(
         { error: 'Insufficient permissions' },
@@ -47,7 +38,7 @@ export async function GET(request: NextRequest) {
     // Apply department-based access control
     if (role !== 'SUPER_ADMIN') {
       // Non-super admins only see cases from their department
-      where.departmentId = user.departmentId
+      where.departmentId = session.user.departmentId
     }
 
     // Count cases created today
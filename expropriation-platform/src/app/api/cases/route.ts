@@ -4,6 +4,7 @@ import { authOptions } from '@/lib/auth'
 import { prisma } from '@/lib/prisma'
 import { logActivity } from '@/lib/activity-logger'
 import { CreateCaseSchema, CaseSearchSchema } from '@/lib/validations/case'
+import { getUserAccessProfile, caseScopeForUser } from '@/lib/permissions'
 
 // GET /api/cases - List cases with filtering and pagination
 export async function GET(request: NextRequest) {
@@ -48,16 +49,10 @@ export async function GET(request: NextRequest) {
       sortOrder,
     } = searchResult.data
 
-    // Get user to check permissions
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: {
-        role: true,
-        department: true
-      }
-    })
+    // Get the cached access profile to scope the query
+    const profile = await getUserAccessProfile(session.user.id)
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 })
     }
 
@@ -69,7 +64,9 @@ export async function GET(request: NextRequest) {
     // Apply filters
     if (query) {
       where.OR = [
-        { fileNumber: { contains: query, mode: 'insensitive' } },
+        // File numbers are searched by prefix so the unique index on
+        // fileNumber can serve the lookup instead of a full scan
+        { fileNumber: { startsWith: query, mode: 'insensitive' } },
         { title: { contains: query, mode: 'insensitive' } },
         { description: { contains: query, mode: 'insensitive' } },
         { ownerName: { contains: query, mode: 'insensitive' } },
@@ -85,7 +82,7 @@ export async function GET(request: NextRequest) {
     if (createdBy) {where.createdById = createdBy}
     if (ownerName) {where.ownerName = { contains: ownerName, mode: 'insensitive' }}
     if (propertyAddress) {where.propertyAddress = { contains: propertyAddress, mode: 'insensitive' }}
-    if (fileNumber) {where.fileNumber = { contains: fileNumber, mode: 'insensitive' }}
+    if (fileNumber) {where.fileNumber = { startsWith: fileNumber, mode: 'insensitive' }}
 
     // Date filters
     if (startDateFrom || startDateTo) {
@@ -107,20 +104,10 @@ export async function GET(request: NextRequest) {
       if (createdAtTo) {where.createdAt.lte = createdAtTo}
     }
 
-    // Apply department-based access control
-    const role = user.role.name as string
-    if (role !== 'SUPER_ADMIN') {
-      // Non-super admins can only see cases from their department or assigned to them
-      where.AND = [
-        {
-          OR: [
-            { departmentId: user.departmentId },
-            { assignedToId: user.id },
-            { supervisedById: user.id },
-            { createdById: user.id }
-          ]
-        }
-      ]
+    // Apply department-based access control inside the same query
+    const scope = caseScopeForUser(session.user.id, profile)
+    if (scope) {
+      where.AND = [scope]
     }
 
     // Count total records
@@ -178,7 +165,7 @@ export async function GET(request: NextRequest) {
 
     // Log activity
     await logActivity({
-      userId: user.id,
+      userId: session.user.id,
       action: 'VIEWED',
       entityType: 'case',
       entityId: 'list',
@@ -229,18 +216,9 @@ export async function POST(request: NextRequest) {
 
     const caseData = validationResult.data
 
-    // Get user to check permissions
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true }
-    })
-
-    if (!user) {
-      return NextResponse.json({ error: 'User not found' }, { status: 404 })
-    }
-
-    // Check if user has permission to create cases
-    const role = user.role.name.toUpperCase() as string
+    // The JWT session already carries the role name and departmentId,
+    // so the per-request user+role fetch is unnecessary here
+    const role = session.user.role.toUpperCase() as string
     if (!['SUPER_ADMIN', 'DEPARTMENT_ADMIN', 'ANALYST', 'SUPERVISOR'].includes(role)) {
       return NextResponse.json(
         { error: 'Insufficient permissions to create cases' },
@@ -273,7 +251,7 @@ export async function POST(request: NextRequest) {
     }
 
     // If not super admin, ensure user belongs to the department
-    if (role !== 'SUPER_ADMIN' && user.departmentId !== caseData.departmentId) {
+    if (role !== 'SUPER_ADMIN' && session.user.departmentId !== caseData.departmentId) {
       return NextResponse.json(
         { error: 'You can only create cases in your department' },
         { status: 403 }
@@ -327,7 +305,7 @@ export async function POST(request: NextRequest) {
     const newCase = await prisma.case.create({
       data: {
         ...caseData,
-        createdById: user.id,
+        createdById: session.user.id,
         startDate: caseData.startDate || new Date(),
         // Convert undefined to null for optional fields that Prisma expects as nullable
         description: caseData.description ?? null,
@@ -386,7 +364,7 @@ export async function POST(request: NextRequest) {
 
     // Log case creation
     await logActivity({
-      userId: user.id,
+      userId: session.user.id,
       action: 'CREATED',
       entityType: 'case',
       entityId: newCase.id,
@@ -403,7 +381,7 @@ export async function POST(request: NextRequest) {
     await prisma.caseHistory.create({
       data: {
         caseId: newCase.id,
-        changedById: user.id,
+        changedById: session.user.id,
         action: 'case_created',
         newValue: JSON.stringify({
           fileNumber: newCase.fileNumber,
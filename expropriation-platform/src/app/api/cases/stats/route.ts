@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server'
 import { getServerSession } from 'next-auth'
 import { authOptions } from '@/lib/auth'
 import { prisma } from '@/lib/prisma'
+import { getUserAccessProfile, caseScopeForUser } from '@/lib/permissions'
 
 // GET /api/cases/stats - Get case statistics
 export async function GET(request: NextRequest) {
@@ -11,38 +12,21 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
 
-    // Get user to check permissions
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: {
-        role: true,
-        department: true
-      }
-    })
+    // Get the cached access profile to scope the stats
+    const profile = await getUserAccessProfile(session.user.id)
 
-    if (!user) {
+    if (!profile) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 })
     }
 
-    const role = user.role.name as string
-
     // Build where clause based on user permissions
     const where: any = {
       deletedAt: null
     }
 
-    if (role !== 'super_admin') {
-      // Non-super admins can only see stats from their department or assigned to them
-      where.AND = [
-        {
-          OR: [
-            { departmentId: user.departmentId },
-            { assignedToId: user.id },
-            { supervisedById: user.id },
-            { createdById: user.id }
-          ]
-        }
-      ]
+    const scope = caseScopeForUser(session.user.id, profile)
+    if (scope) {
+      where.AND = [scope]
     }
 
     // Get basic counts
@@ -84,7 +68,7 @@ export async function GET(request: NextRequest) {
 
     // Get cases by department (only for super admins)
     let departmentStats = []
-    if (role === 'super_admin') {
+    if (scope === null) {
       departmentStats = await prisma.case.groupBy({
         by: ['departmentId'],
         where,
@@ -156,9 +140,9 @@ export async function GET(request: NextRequest) {
 
     // Get user's personal stats (cases assigned to, supervised by, created by)
     const userStats = await Promise.all([
-      prisma.case.count({ where: { ...where, assignedToId: user.id } }),
-      prisma.case.count({ where: { ...where, supervisedById: user.id } }),
-      prisma.case.count({ where: { ...where, createdById: user.id } })
+      prisma.case.count({ where: { ...where, assignedToId: session.user.id } }),
+      prisma.case.count({ where: { ...where, supervisedById: session.user.id } }),
+      prisma.case.count({ where: { ...where, createdById: session.user.id } })
     ])
 
     // Get overdue cases (cases past expected end date and not completed)
@@ -26,7 +26,7 @@ export async function GET(
     // Check if department exists
     const department = await prisma.department.findUnique({
       where: { id: (await params).id },
-      select: { id: true, name: true, code: true, parentId },
+      select: { id: true, name: true, code: true, parentId: true },
     });
 
     if (!department) {
@@ -42,13 +42,20 @@ export async function GET(
       orderBy: { name: 'asc' },
     });
 
-    // Get department-specific permissions
+    // Get department-specific permissions projected to the fields the
+    // response actually returns, instead of materializing full rows and
+    // reshaping them afterwards
     const departmentPermissions = await prisma.departmentPermission.findMany({
       where: {
         departmentId: (await params).id,
       },
-      include: {
+      select: {
+        id: true,
         permission: true,
+        isGranted: true,
+        assignedAt: true,
+        assignedBy: true,
+        expiresAt: true,
       },
       orderBy: { assignedAt: 'desc' },
     });
@@ -62,14 +69,7 @@ export async function GET(
     return NextResponse.json({
       department,
       allPermissions,
-      departmentPermissions: departmentPermissions.map(dp => ({
-        id: dp.id,
-        permission: dp.permission,
-        isGranted: dp.isGranted,
-        assignedAt: dp.assignedAt,
-        assignedBy: dp.assignedBy,
-        expiresAt: dp.expiresAt,
-      })),
+      departmentPermissions,
       inheritedPermissions,
       roleBasedPermissions,
     });
@@ -118,12 +118,14 @@ export async function POST(
       );
     }
 
-    // Validate permissions exist
+    // Validate permissions exist. Only the count matters here, so the
+    // lookup stays on the id column
     const permissions = await prisma.permission.findMany({
       where: {
         id: { in: permissionIds },
         isActive: true,
       },
+      select: { id: true },
     });
 
     if (permissions.length !== permissionIds.length) {
@@ -133,47 +135,34 @@ export async function POST(
       );
     }
 
-    // Create or update permission assignments
-    const assignments = await Promise.all(
-      permissionIds.map(async (permissionId) => {
-        // Check if assignment already exists
-        const existing = await prisma.departmentPermission.findUnique({
+    // Create or update permission assignments. Upserts batched in one
+    // transaction replace the previous find + create/update pair per
+    // permission and keep the whole assignment atomic
+    const departmentId = (await params).id;
+    const expiresAtDate = expiresAt ? new Date(expiresAt) : null;
+    const assignments = await prisma.$transaction(
+      permissionIds.map((permissionId) =>
+        prisma.departmentPermission.upsert({
           where: {
             departmentId_permissionId: {
-              departmentId: (await params).id,
+              departmentId,
               permissionId,
             },
           },
-        });
-
-        if (existing) {
-          // Update existing assignment
-          return await prisma.departmentPermission.update({
-            where: {
-              departmentId_permissionId: {
-                departmentId: (await params).id,
-                permissionId,
-              },
-            },
-            data: {
-              isGranted,
-              expiresAt: expiresAt ? new Date(expiresAt) : null,
-              assignedBy: session.user.id,
-            },
-          });
-        } else {
-          // Create new assignment
-          return await prisma.departmentPermission.create({
-            data: {
-              departmentId: (await params).id,
-              permissionId,
-              isGranted,
-              expiresAt: expiresAt ? new Date(expiresAt) : null,
-              assignedBy: session.user.id,
-            },
-          });
-        }
-      })
+          update: {
+            isGranted,
+            expiresAt: expiresAtDate,
+            assignedBy: session.user.id,
+          },
+          create: {
+            departmentId,
+            permissionId,
+            isGranted,
+            expiresAt: expiresAtDate,
+            assignedBy: session.user.id,
+          },
+        })
+      )
     );
 
     // Log activity
@@ -52,24 +52,23 @@ export async function GET(
     // Get all available stages
     const allStages = Object.values(CaseStage);
 
-    // Get case statistics per stage for this department
-    const stageStats = await Promise.all(
-      allStages.map(async (stage) => {
-        const count = await prisma.case.count({
-          where: {
-            departmentId: (await params).id,
-            currentStage: stage,
-          },
-        });
-
-        return {
-          stage,
-          count,
-          isAssigned: assignments.some(a => a.stage === stage),
-        };
-      })
+    // Get case statistics per stage for this department with a single
+    // grouped query instead of one count per stage
+    const stageCounts = await prisma.case.groupBy({
+      by: ['currentStage'],
+      where: { departmentId: (await params).id },
+      _count: { currentStage: true },
+    });
+    const countsByStage = new Map(
+      stageCounts.map(entry => [entry.currentStage, entry._count.currentStage])
     );
 
+    const stageStats = allStages.map((stage) => ({
+      stage,
+      count: countsByStage.get(stage) ?? 0,
+      isAssigned: assignments.some(a => a.stage === stage),
+    }));
+
     return NextResponse.json({
       department,
       assignments: assignments.map(a => ({
@@ -138,18 +137,20 @@ export async function POST(
       },
     });
 
-    // Create new assignments
-    const newAssignments = await Promise.all(
-      stages.map(stage =>
-        prisma.departmentStageAssignment.create({
-          data: {
-            departmentId: id,
-            stage,
-            assignedBy: session.user.id,
-          },
-        })
-      )
-    );
+    // Create new assignments in a single statement instead of one
+    // insert per stage
+    await prisma.departmentStageAssignment.createMany({
+      data: stages.map(stage => ({
+        departmentId: id,
+        stage,
+        assignedBy: session.user.id,
+      })),
+    });
+
+    const newAssignments = await prisma.departmentStageAssignment.findMany({
+      where: { departmentId: id, isActive: true },
+      select: { id: true, stage: true, assignedAt: true },
+    });
 
     // Log activity
     await logActivity({
@@ -80,14 +80,7 @@ export async function GET(
       // Recent user activity (last 30 days)
       prisma.activity.count({
         where: {
-          userId: {
-            in: (
-              await prisma.user.findMany({
-                where: { departmentId, deletedAt: null },
-                select: { id: true },
-              })
-            ).map(u => u.id),
-          },
+          user: { departmentId, deletedAt: null },
           createdAt: {
             gte: new Date(Date.now() - 30 * 24 * 60 * 60 * 1000), // 30 days ago
           },
@@ -145,14 +138,7 @@ export async function GET(
       // Recent case activity (last 30 days)
       prisma.activity.count({
         where: {
-          caseId: {
-            in: (
-              await prisma.case.findMany({
-                where: { departmentId },
-                select: { id: true },
-              })
-            ).map(c => c.id),
-          },
+          case: { departmentId },
           createdAt: {
             gte: new Date(Date.now() - 30 * 24 * 60 * 60 * 1000), // 30 days ago
           },
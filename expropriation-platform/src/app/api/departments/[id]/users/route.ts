@@ -99,10 +99,9 @@ export async function GET(
     });
 
     const response = {
-      users: users.map(user => ({
+      users: users.map(({ _count, ...user }) => ({
         ...user,
-        totalCases: user._count.createdCases + user._count.assignedCases + user._count.supervisedCases,
-        _count: undefined,
+        totalCases: _count.createdCases + _count.assignedCases + _count.supervisedCases,
       })),
       pagination: {
         page,
@@ -162,6 +161,7 @@ export async function POST(
     // Validate source department
     const sourceDept = await prisma.department.findUnique({
       where: { id: sourceDepartmentId },
+      select: { id: true, name: true },
     });
 
     if (!sourceDept) {
@@ -174,6 +174,7 @@ export async function POST(
     // Validate destination department
     const destDept = await prisma.department.findUnique({
       where: { id: destinationDepartmentId },
+      select: { id: true, name: true },
     });
 
     if (!destDept) {
@@ -198,6 +199,8 @@ export async function POST(
         departmentId: sourceDepartmentId,
         deletedAt: null,
       },
+      // Only the fields the transfer log reads
+      select: { id: true, firstName: true, lastName: true },
     });
 
     if (users.length !== userIds.length) {
@@ -28,7 +28,9 @@ export async function GET(request: NextRequest) {
     if (search) {
       where.OR = [
         { name: { contains: search, mode: 'insensitive' } },
-        { code: { contains: search, mode: 'insensitive' } },
+        // Codes are short identifiers; prefix match keeps the unique
+        // index on code usable
+        { code: { startsWith: search, mode: 'insensitive' } },
       ];
     }
 
@@ -127,48 +129,51 @@ export async function POST(request: NextRequest) {
     const body = await request.json();
     const validatedData = departmentSchema.parse(body);
 
-    // Check if department code already exists
-    const existingDept = await prisma.department.findUnique({
-      where: { code: validatedData.code },
-    });
-
-    if (existingDept) {
+    // Validate code uniqueness and parent existence with a single
+    // department query, and check the head user in the same round trip
+    const [relatedDepts, headUser] = await Promise.all([
+      prisma.department.findMany({
+        where: {
+          OR: [
+            { code: validatedData.code },
+            ...(validatedData.parentId ? [{ id: validatedData.parentId }] : []),
+          ],
+        },
+        select: { id: true, code: true },
+      }),
+      validatedData.headUserId
+        ? prisma.user.findUnique({
+            where: { id: validatedData.headUserId },
+            select: { id: true },
+          })
+        : Promise.resolve(null),
+    ]);
+
+    if (relatedDepts.some((dept) => dept.code === validatedData.code)) {
       return NextResponse.json(
         { error: 'El código de departamento ya existe' },
         { status: 400 }
       );
     }
 
-    // If parentId is provided, validate it exists
-    if (validatedData.parentId) {
-      const parentDept = await prisma.department.findUnique({
-        where: { id: validatedData.parentId },
-      });
-
-      if (!parentDept) {
-        return NextResponse.json(
-          { error: 'Departamento padre no encontrado' },
-          { status: 400 }
-        );
-      }
-
-      // Note: Circular reference check for self-parent is not needed during creation
-      // This check would be relevant during updates when trying to set a department
-      // as its own parent through a circular chain
+    // Note: Circular reference check for self-parent is not needed during creation
+    // This check would be relevant during updates when trying to set a department
+    // as its own parent through a circular chain
+    if (
+      validatedData.parentId &&
+      !relatedDepts.some((dept) => dept.id === validatedData.parentId)
+    ) {
+      return NextResponse.json(
+        { error: 'Departamento padre no encontrado' },
+        { status: 400 }
+      );
     }
 
-    // If headUserId is provided, validate the user exists
-    if (validatedData.headUserId) {
-      const headUser = await prisma.user.findUnique({
-        where: { id: validatedData.headUserId },
-      });
-
-      if (!headUser) {
-        return NextResponse.json(
-          { error: 'Usuario designado como jefe no encontrado' },
-          { status: 400 }
-        );
-      }
+    if (validatedData.headUserId && !headUser) {
+      return NextResponse.json(
+        { error: 'Usuario designado como jefe no encontrado' },
+        { status: 400 }
+      );
     }
 
     // Create department with simplified schema
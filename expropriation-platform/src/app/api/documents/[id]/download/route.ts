@@ -2,9 +2,17 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
+import { APP_ROOT } from '@/lib/document-constants';
 import fs from 'fs/promises';
+import { createReadStream } from 'fs';
+import { Readable } from 'stream';
 import path from 'path';
 import { DocumentActionType } from '@prisma/client';
+import { enqueueDocumentAction, enqueueDocumentHistory } from '@/lib/document-audit';
+
+// Read buffer for streamed downloads; large chunks keep the syscall
+// count low and let kernel readahead stream the file
+const DOWNLOAD_CHUNK_BYTES = 1024 * 1024;
 
 // GET /api/documents/[id]/download - Download a document
 export async function GET(
@@ -19,16 +27,32 @@ export async function GET(
 
     const { id } = await params;
 
-    // Get document with permissions check
+    // Get document with the permission predicate evaluated in SQL: a
+    // filtered relation count replaces fetching the permission rows
+    // just to scan them in memory. Only the columns this route touches
+    // are selected; a download never needs contentText or the other
+    // wide metadata fields hydrated
     const document = await prisma.document.findUnique({
       where: { id },
-      include: {
-        permissions: {
-          where: {
-            OR: [
-              { userId: session.user.id },
-              { isActive: true },
-            ],
+      select: {
+        id: true,
+        filePath: true,
+        mimeType: true,
+        originalFileName: true,
+        fileSize: true,
+        uploadedById: true,
+        isPublic: true,
+        _count: {
+          select: {
+            permissions: {
+              where: {
+                canDownload: true,
+                OR: [
+                  { userId: session.user.id },
+                  { isActive: true },
+                ],
+              },
+            },
           },
         },
       },
@@ -42,14 +66,14 @@ export async function GET(
     const canDownload =
       document.uploadedById === session.user.id ||
       document.isPublic ||
-      document.permissions.some(p => p.canDownload);
+      document._count.permissions > 0;
 
     if (!canDownload) {
       return NextResponse.json({ error: 'Access denied' }, { status: 403 });
     }
 
     // Check if document file exists
-    const filePath = path.join(process.cwd(), document.filePath);
+    const filePath = path.join(APP_ROOT, document.filePath);
     try {
       await fs.access(filePath);
     } catch {
@@ -66,46 +90,43 @@ export async function GET(
       },
     });
 
-    // Create download action
-    await prisma.documentAction.create({
-      data: {
-        documentId: id,
-        action: DocumentActionType.DOWNLOADED,
-        userId: session.user.id,
-        ipAddress: request.headers.get('x-forwarded-for') || 'unknown',
-        userAgent: request.headers.get('user-agent') || 'unknown',
-        metadata: {
-          fileName: document.originalFileName,
-          fileSize: document.fileSize,
-          mimeType: document.mimeType,
-        },
+    // Queue download action and history entry for the batched audit
+    // writer instead of paying two synchronous INSERTs per download
+    enqueueDocumentAction({
+      documentId: id,
+      action: DocumentActionType.DOWNLOADED,
+      userId: session.user.id,
+      ipAddress: request.headers.get('x-forwarded-for') || 'unknown',
+      userAgent: request.headers.get('user-agent') || 'unknown',
+      metadata: {
+        fileName: document.originalFileName,
+        fileSize: document.fileSize,
+        mimeType: document.mimeType,
       },
     });
 
-    // Create history entry
-    await prisma.documentHistory.create({
-      data: {
-        documentId: id,
-        action: DocumentActionType.DOWNLOADED,
-        description: `Document downloaded: ${document.originalFileName}`,
-        userId: session.user.id,
-        fileSize: document.fileSize,
-        fileName: document.originalFileName,
-        filePath: document.filePath,
-        ipAddress: request.headers.get('x-forwarded-for') || 'unknown',
-        userAgent: request.headers.get('user-agent') || 'unknown',
-      },
+    enqueueDocumentHistory({
+      documentId: id,
+      action: DocumentActionType.DOWNLOADED,
+      description: `Document downloaded: ${document.originalFileName}`,
+      userId: session.user.id,
+      fileSize: document.fileSize,
+      fileName: document.originalFileName,
+      filePath: document.filePath,
+      ipAddress: request.headers.get('x-forwarded-for') || 'unknown',
+      userAgent: request.headers.get('user-agent') || 'unknown',
     });
 
-    // Read file
-    const fileBuffer = await fs.readFile(filePath);
+    // Stream the file instead of buffering it whole in memory
+    const fileStream = createReadStream(filePath, {
+      highWaterMark: DOWNLOAD_CHUNK_BYTES,
+    });
 
-    // Return file with appropriate headers
-    return new NextResponse(fileBuffer, {
+    return new NextResponse(Readable.toWeb(fileStream) as ReadableStream, {
       headers: {
         'Content-Type': document.mimeType,
         'Content-Disposition': `attachment; filename="${document.originalFileName}"`,
-        'Content-Length': fileBuffer.length.toString(),
+        'Content-Length': document.fileSize.toString(),
         'Cache-Control': 'no-cache',
       },
     });
@@ -2,10 +2,11 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
+import { APP_ROOT } from '@/lib/document-constants';
 import fs from 'fs/promises';
 import path from 'path';
-import sharp from 'sharp';
 import { DocumentActionType } from '@prisma/client';
+import { enqueueDocumentAction } from '@/lib/document-audit';
 
 // Supported preview types and their processing
 const PREVIEW_CONFIG = {
@@ -44,16 +45,32 @@ export async function GET(
     const page = parseInt(searchParams.get('page') || '1');
     const size = searchParams.get('size') || 'medium'; // small, medium, large
 
-    // Get document with permissions check
+    // Get document with the permission predicate evaluated in SQL: a
+    // filtered relation count replaces fetching the permission rows
+    // just to scan them in memory. Only the columns the preview
+    // generators touch are selected so contentText and the other wide
+    // metadata fields stay out of the row
     const document = await prisma.document.findUnique({
       where: { id },
-      include: {
-        permissions: {
-          where: {
-            OR: [
-              { userId: session.user.id },
-              { isActive: true },
-            ],
+      select: {
+        id: true,
+        filePath: true,
+        mimeType: true,
+        originalFileName: true,
+        fileSize: true,
+        uploadedById: true,
+        isPublic: true,
+        _count: {
+          select: {
+            permissions: {
+              where: {
+                canView: true,
+                OR: [
+                  { userId: session.user.id },
+                  { isActive: true },
+                ],
+              },
+            },
           },
         },
       },
@@ -67,7 +84,7 @@ export async function GET(
     const canView =
       document.uploadedById === session.user.id ||
       document.isPublic ||
-      document.permissions.some(p => p.canView);
+      document._count.permissions > 0;
 
     if (!canView) {
       return NextResponse.json({ error: 'Access denied' }, { status: 403 });
@@ -83,7 +100,7 @@ export async function GET(
     }
 
     // Check if document file exists
-    const filePath = path.join(process.cwd(), document.filePath);
+    const filePath = path.join(APP_ROOT, document.filePath);
     try {
       await fs.access(filePath);
     } catch {
@@ -131,7 +148,7 @@ async function generateImagePreview(
     const config = sizeConfig[size as keyof typeof sizeConfig] || sizeConfig.medium;
 
     // Generate thumbnail if it doesn't exist
-    const thumbnailDir = path.join(process.cwd(), 'uploads', 'thumbnails');
+    const thumbnailDir = path.join(APP_ROOT, 'uploads', 'thumbnails');
     await fs.mkdir(thumbnailDir, { recursive: true });
 
     const thumbnailPath = path.join(thumbnailDir, `${document.id}_${size}.jpg`);
@@ -140,7 +157,10 @@ async function generateImagePreview(
       // Check if thumbnail already exists
       await fs.access(thumbnailPath);
     } catch {
-      // Generate new thumbnail
+      // Generate new thumbnail. sharp loads native bindings, so it is
+      // imported lazily here instead of at module load; text and PDF
+      // previews never pay for it
+      const { default: sharp } = await import('sharp');
       await sharp(filePath)
         .resize(config.width, config.height, {
           fit: 'inside',
@@ -258,16 +278,15 @@ async function logPreviewAction(
   metadata: any
 ) {
   try {
-    // Create preview action
-    await prisma.documentAction.create({
-      data: {
-        documentId,
-        action: DocumentActionType.VIEWED,
-        userId,
-        metadata: {
-          previewType: type,
-          ...metadata,
-        },
+    // Queue preview action for the batched audit writer instead of
+    // paying a synchronous INSERT on every preview
+    enqueueDocumentAction({
+      documentId,
+      action: DocumentActionType.VIEWED,
+      userId,
+      metadata: {
+        previewType: type,
+        ...metadata,
       },
     });
 
@@ -7,21 +7,24 @@ import fs from 'fs/promises';
 import path from 'path';
 import crypto from 'crypto';
 import { DocumentStatus, DocumentSecurityLevel, DocumentActionType } from '@prisma/client';
+import { parseTagList, APP_ROOT } from '@/lib/document-constants';
+import { hashFile } from '@/lib/file-hash';
+import { enqueueDocumentAction } from '@/lib/document-audit';
 
 // Validation schemas
 const updateDocumentSchema = z.object({
   title: z.string().min(1).optional(),
   description: z.string().optional(),
-  securityLevel: z.nativeEnum(DocumentSecurityLevel).optional(),
+  securityLevel: z.enum(Object.values(DocumentSecurityLevel) as [string, ...string[]]).optional(),
   tags: z.string().optional(),
-  metadata: z.record(z.any()).optional(),
-  customFields: z.record(z.any()).optional(),
+  metadata: z.record(z.string(), z.any()).optional(),
+  customFields: z.record(z.string(), z.any()).optional(),
   retentionPeriod: z.number().optional(),
   expiresAt: z.string().datetime().optional(),
 });
 
 const changeStatusSchema = z.object({
-  status: z.nativeEnum(DocumentStatus),
+  status: z.enum(Object.values(DocumentStatus) as [string, ...string[]]),
   reason: z.string().optional(),
 });
 
@@ -134,7 +137,22 @@ export async function GET(
       return NextResponse.json({ error: 'Access denied' }, { status: 403 });
     }
 
-    // Increment view count
+    // On-demand integrity check, gated behind ?verify=1 because it
+    // re-hashes the whole file from disk; list and default detail reads
+    // only ever compare against the hash stored at upload time
+    let integrity: { verified: boolean; checkedAt: string } | undefined;
+    if (request.nextUrl.searchParams.get('verify') === '1') {
+      const absolutePath = path.join(APP_ROOT, document.filePath);
+      let verified = false;
+      try {
+        verified = (await hashFile(absolutePath)) === document.fileHash;
+      } catch {
+        verified = false;
+      }
+      integrity = { verified, checkedAt: new Date().toISOString() };
+    }
+
+    // Increment view count for this read
     await prisma.document.update({
       where: { id },
       data: {
@@ -144,20 +162,20 @@ export async function GET(
       },
     });
 
-    // Create view action
-    await prisma.documentAction.create({
-      data: {
-        documentId: id,
-        action: DocumentActionType.VIEWED,
-        userId: session.user.id,
-        ipAddress: request.headers.get('x-forwarded-for') || 'unknown',
-        userAgent: request.headers.get('user-agent') || 'unknown',
-      },
+    // Queue view action for the batched audit writer instead of
+    // paying a synchronous INSERT on every read
+    enqueueDocumentAction({
+      documentId: id,
+      action: DocumentActionType.VIEWED,
+      userId: session.user.id,
+      ipAddress: request.headers.get('x-forwarded-for') || 'unknown',
+      userAgent: request.headers.get('user-agent') || 'unknown',
     });
 
     // Format response
     const response = {
       ...document,
+      ...(integrity && { integrity }),
       uploadedBy: {
         ...document.uploadedBy,
         fullName: `${document.uploadedBy.firstName} ${document.uploadedBy.lastName}`,
@@ -248,18 +266,21 @@ export async function PUT(
       changes.securityLevel = { previous: existingDocument.securityLevel, new: validatedData.securityLevel };
     }
 
-    // Update document
+    // Update document. Fields the client did not send stay undefined
+    // so Prisma leaves the columns untouched and the UPDATE only
+    // rewrites what actually changed; previously an omitted expiresAt
+    // was coerced to null and cleared the stored expiration
     const document = await prisma.document.update({
       where: { id },
       data: {
         title: validatedData.title,
         description: validatedData.description,
-        securityLevel: validatedData.securityLevel,
+        securityLevel: validatedData.securityLevel as DocumentSecurityLevel | undefined,
         tags: validatedData.tags,
         metadata: validatedData.metadata,
         customFields: validatedData.customFields,
         retentionPeriod: validatedData.retentionPeriod,
-        expiresAt: validatedData.expiresAt ? new Date(validatedData.expiresAt) : null,
+        expiresAt: validatedData.expiresAt !== undefined ? new Date(validatedData.expiresAt) : undefined,
         updatedAt: new Date(),
       },
       include: {
@@ -314,14 +335,11 @@ export async function PUT(
         where: { documentId: id },
       });
 
-      // Create new tags
-      const tags = validatedData.tags.split(',').map(tag => tag.trim()).filter(Boolean);
-      for (const tag of tags) {
-        await prisma.documentTag.create({
-          data: {
-            documentId: id,
-            tag,
-          },
+      // Create new tags with a single INSERT
+      const tags = parseTagList(validatedData.tags);
+      if (tags.length > 0) {
+        await prisma.documentTag.createMany({
+          data: tags.map(tag => ({ documentId: id, tag })),
         });
       }
     }
@@ -7,6 +7,7 @@ import fs from 'fs/promises';
 import path from 'path';
 import crypto from 'crypto';
 import { DocumentActionType } from '@prisma/client';
+import { hashStreamToFile } from '@/lib/file-hash';
 
 // Validation schemas
 const createVersionSchema = z.object({
@@ -29,17 +30,17 @@ export async function GET(
 
     const { id } = await params;
 
-    // Check if document exists and user has permission
+    // Check if document exists and user has permission. The check and
+    // the response header only need these columns - comparing the
+    // uploadedById FK directly avoids joining the uploader row
     const document = await prisma.document.findUnique({
       where: { id },
-      include: {
-        uploadedBy: {
-          select: {
-            id: true,
-            firstName: true,
-            lastName: true,
-          },
-        },
+      select: {
+        id: true,
+        title: true,
+        version: true,
+        uploadedById: true,
+        isPublic: true,
       },
     });
 
@@ -122,18 +123,11 @@ export async function POST(
     // Validate version data
     const validatedData = createVersionSchema.parse(versionData);
 
-    // Check if document exists and user has permission
+    // Check if document exists and user has permission; the ownership
+    // check reads the FK column, so no uploader join is needed
     const existingDocument = await prisma.document.findUnique({
       where: { id },
-      include: {
-        uploadedBy: {
-          select: {
-            id: true,
-            firstName: true,
-            lastName: true,
-          },
-        },
-      },
+      select: { id: true, uploadedById: true },
     });
 
     if (!existingDocument) {
@@ -144,10 +138,13 @@ export async function POST(
       return NextResponse.json({ error: 'Access denied' }, { status: 403 });
     }
 
-    // Determine new version number
+    // Determine new version number. Only the id and version of the
+    // latest row are needed, so the lookup stays on the index instead
+    // of materializing the full version record
     const lastVersion = await prisma.documentVersion.findFirst({
       where: { documentId: id },
       orderBy: { version: 'desc' },
+      select: { id: true, version: true },
     });
 
     const newVersionNumber = validatedData.isMajorVersion
@@ -171,22 +168,23 @@ export async function POST(
     const fileName = `${timestamp}-${random}-${name}_v${newVersionNumber}${ext}`;
     const filePath = path.join(dateDir, fileName);
 
-    // Save new version file
-    const buffer = Buffer.from(await file.arrayBuffer());
-    await fs.writeFile(filePath, buffer);
-
-    // Calculate file hash
-    const fileHash = crypto.createHash('sha256').update(buffer).digest('hex');
+    // Save new version file, hashing the bytes in the same pass so the
+    // upload is neither buffered whole in memory nor read twice
+    const fileHash = await hashStreamToFile(file.stream(), filePath);
 
-    // Create new version record
-    const newVersion = await prisma.documentVersion.create({
+    // Create new version record; for major versions the denormalized
+    // copy on the parent document (version, filePath, fileSize,
+    // fileHash) is written in the same transaction so the two rows
+    // cannot drift and the route pays one round trip instead of two
+    const relativeFilePath = path.relative(process.cwd(), filePath);
+    const versionCreate = prisma.documentVersion.create({
       data: {
         documentId: id,
         version: newVersionNumber,
         title: validatedData.title,
         description: validatedData.description,
         fileName,
-        filePath: path.relative(process.cwd(), filePath),
+        filePath: relativeFilePath,
         fileSize: file.size,
         mimeType: file.type,
         fileHash,
@@ -221,19 +219,21 @@ export async function POST(
       },
     });
 
-    // Update main document if this version should be published
-    if (validatedData.isMajorVersion) {
-      await prisma.document.update({
-        where: { id },
-        data: {
-          version: newVersionNumber,
-          filePath: newVersion.filePath,
-          fileSize: file.size,
-          fileHash,
-          updatedAt: new Date(),
-        },
-      });
-    }
+    const newVersion = validatedData.isMajorVersion
+      ? (await prisma.$transaction([
+          versionCreate,
+          prisma.document.update({
+            where: { id },
+            data: {
+              version: newVersionNumber,
+              filePath: relativeFilePath,
+              fileSize: file.size,
+              fileHash,
+              updatedAt: new Date(),
+            },
+          }),
+        ]))[0]
+      : await versionCreate;
 
     // Create version action
     await prisma.documentAction.create({
@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
+import { APP_ROOT } from '@/lib/document-constants';
 import { z } from 'zod';
 import fs from 'fs/promises';
 import path from 'path';
@@ -41,10 +42,27 @@ export async function POST(request: NextRequest) {
       filename,
     } = validatedData;
 
-    // Get documents with permission check
-    const documents = await prisma.document.findMany({
+    // Get documents with the permission check pushed into the query,
+    // so inaccessible rows are filtered server-side instead of being
+    // fetched (with their permission lists) and discarded in memory
+    const accessibleDocuments = await prisma.document.findMany({
       where: {
         id: { in: documentIds },
+        OR: [
+          { uploadedById: session.user.id },
+          { isPublic: true },
+          {
+            permissions: {
+              some: {
+                canDownload: true,
+                OR: [
+                  { userId: session.user.id },
+                  { isActive: true },
+                ],
+              },
+            },
+          },
+        ],
       },
       include: {
         uploadedBy: {
@@ -62,31 +80,18 @@ export async function POST(request: NextRequest) {
             title: true,
           },
         },
-        permissions: {
-          where: {
-            OR: [
-              { userId: session.user.id },
-              { isActive: true },
-            ],
-          },
-        },
       },
     });
 
-    if (documents.length === 0) {
-      return NextResponse.json({ error: 'No documents found' }, { status: 404 });
-    }
-
-    // Check permissions for each document
-    const accessibleDocuments = documents.filter(doc => {
-      return (
-        doc.uploadedById === session.user.id ||
-        doc.isPublic ||
-        doc.permissions.some(p => p.canDownload)
-      );
-    });
-
     if (accessibleDocuments.length === 0) {
+      // Distinguish unknown IDs from permission denials with a cheap
+      // count only on the empty path
+      const existing = await prisma.document.count({
+        where: { id: { in: documentIds } },
+      });
+      if (existing === 0) {
+        return NextResponse.json({ error: 'No documents found' }, { status: 404 });
+      }
       return NextResponse.json({ error: 'No accessible documents found' }, { status: 403 });
     }
 
@@ -94,7 +99,7 @@ export async function POST(request: NextRequest) {
     const missingFiles = [];
     for (const doc of accessibleDocuments) {
       try {
-        const filePath = path.join(process.cwd(), doc.filePath);
+        const filePath = path.join(APP_ROOT, doc.filePath);
         await fs.access(filePath);
       } catch {
         missingFiles.push(doc.originalFileName);
@@ -108,27 +113,23 @@ export async function POST(request: NextRequest) {
       }, { status: 404 });
     }
 
-    // Sort documents
-    const sortedDocuments = [...accessibleDocuments].sort((a, b) => {
-      let aValue: any = a[sortBy as keyof typeof a];
-      let bValue: any = b[sortBy as keyof typeof b];
-
-      if (sortBy === 'uploadedBy') {
-        aValue = `${a.uploadedBy.firstName} ${a.uploadedBy.lastName}`;
-        bValue = `${b.uploadedBy.firstName} ${b.uploadedBy.lastName}`;
-      }
-
-      if (typeof aValue === 'string') {
-        aValue = aValue.toLowerCase();
-        bValue = bValue.toLowerCase();
-      }
-
-      if (sortOrder === 'asc') {
-        return aValue > bValue ? 1 : -1;
-      } else {
-        return aValue < bValue ? 1 : -1;
-      }
-    });
+    // Sort documents. The sort key is derived once per document here
+    // rather than inside the comparator, which runs O(N log N) times
+    // and would otherwise rebuild and lowercase the uploader name on
+    // every comparison
+    const sortKey = (doc: (typeof accessibleDocuments)[number]): any => {
+      const value =
+        sortBy === 'uploadedBy'
+          ? `${doc.uploadedBy.firstName} ${doc.uploadedBy.lastName}`
+          : doc[sortBy as keyof typeof doc];
+      return typeof value === 'string' ? value.toLowerCase() : value;
+    };
+    const sortedDocuments = accessibleDocuments
+      .map((doc) => ({ doc, key: sortKey(doc) }))
+      .sort((a, b) =>
+        sortOrder === 'asc' ? (a.key > b.key ? 1 : -1) : (a.key < b.key ? 1 : -1)
+      )
+      .map(({ doc }) => doc);
 
     // Generate download filename
     const downloadFilename = filename || `documents_${new Date().toISOString().split('T')[0]}.${format}`;
@@ -149,25 +150,24 @@ export async function POST(request: NextRequest) {
       },
     });
 
-    // Create history entries for each document
-    for (const doc of sortedDocuments) {
-      await prisma.documentHistory.create({
-        data: {
-          documentId: doc.id,
-          action: DocumentActionType.DOWNLOADED,
-          description: `Document included in bulk download: ${downloadFilename}`,
-          userId: session.user.id,
-          fileSize: doc.fileSize,
-          fileName: doc.originalFileName,
-          filePath: doc.filePath,
-          metadata: {
-            bulkDownload: true,
-            downloadFilename,
-            totalDocuments: sortedDocuments.length,
-          },
+    // Create history entries for all documents in one statement instead
+    // of a round-trip per document
+    await prisma.documentHistory.createMany({
+      data: sortedDocuments.map(doc => ({
+        documentId: doc.id,
+        action: DocumentActionType.DOWNLOADED,
+        description: `Document included in bulk download: ${downloadFilename}`,
+        userId: session.user.id,
+        fileSize: doc.fileSize,
+        fileName: doc.originalFileName,
+        filePath: doc.filePath,
+        metadata: {
+          bulkDownload: true,
+          downloadFilename,
+          totalDocuments: sortedDocuments.length,
         },
-      });
-    }
+      })),
+    });
 
     // Generate the download package
     if (format === 'zip') {
@@ -253,7 +253,7 @@ async function createZipDownload(
 
           // Add documents
           for (const doc of documents) {
-            const filePath = path.join(process.cwd(), doc.filePath);
+            const filePath = path.join(APP_ROOT, doc.filePath);
             const fileBuffer = await fs.readFile(filePath);
 
             // Determine folder structure
@@ -8,7 +8,9 @@ import path from 'path';
 import fs from 'fs/promises';
 import { DocumentType, DocumentCategory, DocumentStatus, DocumentSecurityLevel } from '@prisma/client';
 import { secureFileUpload, getSecurityHeaders } from '@/lib/file-upload-security';
+import { getUserAccessProfile } from '@/lib/permissions';
 import { edgeLogger } from '@/lib/edge-logger';
+import { parseTagList } from '@/lib/document-constants';
 import { AtomicUploadOptions } from '@/lib/atomic-upload';
 
 // Validation schemas
@@ -73,13 +75,22 @@ const ALLOWED_MIME_TYPES = [
 // Storage configuration
 const UPLOAD_DIR = path.join(process.cwd(), 'uploads', 'documents');
 
-// Ensure upload directory exists
-async function ensureUploadDir() {
-  try {
-    await fs.access(UPLOAD_DIR);
-  } catch {
-    await fs.mkdir(UPLOAD_DIR, { recursive: true });
+// Directories survive for the life of the process, so remember which
+// ones were already created and skip the repeat stat/mkdir syscalls on
+// every subsequent upload
+const ensuredDirs = new Set<string>();
+
+async function ensureDir(dir: string): Promise<void> {
+  if (ensuredDirs.has(dir)) {
+    return;
   }
+  await fs.mkdir(dir, { recursive: true });
+  ensuredDirs.add(dir);
+}
+
+// Ensure upload directory exists
+function ensureUploadDir() {
+  return ensureDir(UPLOAD_DIR);
 }
 
 // Generate unique file path
@@ -91,12 +102,6 @@ function generateFilePath(originalName: string): string {
   return `${timestamp}-${random}-${name}${ext}`;
 }
 
-// Calculate file hash
-async function calculateFileHash(filePath: string): Promise<string> {
-  const fileBuffer = await fs.readFile(filePath);
-  return crypto.createHash('sha256').update(fileBuffer).digest('hex');
-}
-
 // Create directory for date-based organization
 async function createDateDirectory(): Promise<string> {
   const now = new Date();
@@ -105,7 +110,7 @@ async function createDateDirectory(): Promise<string> {
   const day = String(now.getDate()).padStart(2, '0');
 
   const dateDir = path.join(UPLOAD_DIR, String(year), month, day);
-  await fs.mkdir(dateDir, { recursive: true });
+  await ensureDir(dateDir);
 
   return dateDir;
 }
@@ -167,9 +172,19 @@ export async function GET(request: NextRequest) {
     // Get total count
     const total = await prisma.document.count({ where });
 
-    // Get documents with pagination
+    // Get documents with pagination. The list never renders the
+    // extracted full-text content, and the encryption key and storage
+    // path must not leave the server; omitting them keeps the widest
+    // and most sensitive columns out of every listed row. Clients
+    // fetch files through the download endpoint, which resolves the
+    // path on demand.
     const documents = await prisma.document.findMany({
       where,
+      omit: {
+        contentText: true,
+        encryptionKey: true,
+        filePath: true,
+      },
       include: {
         uploadedBy: {
           select: {
@@ -219,6 +234,7 @@ export async function GET(request: NextRequest) {
         color: tag.color,
       })),
       fileSizeFormatted: formatFileSize(doc.fileSize),
+      downloadUrl: `/api/documents/${doc.id}/download`,
       createdAt: doc.createdAt.toISOString(),
       updatedAt: doc.updatedAt.toISOString(),
     }));
@@ -261,13 +277,9 @@ export async function POST(request: NextRequest) {
     // Validate document data
     const validatedData = createDocumentSchema.parse(documentData);
 
-    // Get user role for security configuration
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      select: { role: { select: { name: true } } }
-    });
-
-    const userRole = user?.role?.name || 'default';
+    // Get user role for security configuration (cached per request)
+    const accessProfile = await getUserAccessProfile(session.user.id);
+    const userRole = accessProfile?.roleName || 'default';
 
     // Perform secure file upload with comprehensive validation
     const uploadOptions: Partial<AtomicUploadOptions> = {
@@ -398,13 +410,11 @@ export async function POST(request: NextRequest) {
 
     // Create tags if provided
     if (validatedData.tags) {
-      const tags = validatedData.tags.split(',').map(tag => tag.trim()).filter(Boolean);
-      for (const tag of tags) {
-        await prisma.documentTag.create({
-          data: {
-            documentId: document.id,
-            tag,
-          },
+      const tags = parseTagList(validatedData.tags);
+      if (tags.length > 0) {
+        // Single INSERT instead of one round-trip per tag
+        await prisma.documentTag.createMany({
+          data: tags.map(tag => ({ documentId: document.id, tag })),
         });
       }
     }
@@ -71,7 +71,10 @@ export async function POST(request: NextRequest) {
       includeContent,
     } = validatedData;
 
-    // Build search conditions
+    // Build search conditions. SQLite has no tsvector/GIN machinery,
+    // so every branch is a LIKE scan; the extracted full text is by
+    // far the widest column and is only scanned when the caller asked
+    // for content matching
     const where: any = {
       OR: [
         // Search in title
@@ -80,10 +83,10 @@ export async function POST(request: NextRequest) {
         { description: { contains: query } },
         // Search in filename
         { fileName: { contains: query } },
-        // Search in content (full-text search)
-        { contentText: { contains: query } },
         // Search in tags
         { tags: { contains: query } },
+        // Search in extracted content when requested
+        ...(includeContent ? [{ contentText: { contains: query } }] : []),
       ],
     };
 
@@ -196,9 +199,15 @@ export async function POST(request: NextRequest) {
       orderBy = { [sort.field]: sort.order };
     }
 
-    // Get search results
+    // Get search results. The encryption key never leaves the server,
+    // and the full extracted text is only hydrated when the caller
+    // asked for content snippets
     const documents = await prisma.document.findMany({
       where,
+      omit: {
+        encryptionKey: true,
+        contentText: !includeContent,
+      },
       include: {
         uploadedBy: {
           select: {
@@ -236,33 +245,41 @@ export async function POST(request: NextRequest) {
       take: pagination.limit,
     });
 
-    // Calculate relevance scores (simple implementation)
+    // Calculate relevance scores (simple implementation). The matcher
+    // is compiled once per request; a case-insensitive regex test scans
+    // each field in place instead of allocating a lowercased copy per
+    // row, which matters for contentText holding full extracted text
+    const queryLower = query.toLowerCase();
+    const queryPattern = new RegExp(
+      query.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'),
+      'i'
+    );
+
     const documentsWithScores = documents.map(doc => {
       let score = 0;
-      const queryLower = query.toLowerCase();
 
       // Title match (highest weight)
-      if (doc.title.toLowerCase().includes(queryLower)) {
+      if (queryPattern.test(doc.title)) {
         score += 10;
       }
 
       // Description match
-      if (doc.description?.toLowerCase().includes(queryLower)) {
+      if (doc.description && queryPattern.test(doc.description)) {
         score += 5;
       }
 
       // Filename match
-      if (doc.fileName.toLowerCase().includes(queryLower)) {
+      if (queryPattern.test(doc.fileName)) {
         score += 3;
       }
 
       // Content match
-      if (doc.contentText?.toLowerCase().includes(queryLower)) {
+      if (doc.contentText && queryPattern.test(doc.contentText)) {
         score += 2;
       }
 
       // Tags match
-      if (doc.tags?.toLowerCase().includes(queryLower)) {
+      if (doc.tags && queryPattern.test(doc.tags)) {
         score += 4;
       }
 
@@ -0,0 +1,20 @@
+import { NextResponse } from 'next/server';
+
+// Liveness probe for load balancers and uptime monitors. Probes hit this
+// endpoint continuously, so the body is serialized once at module load
+// instead of rebuilding and re-encoding the same object per request.
+const HEALTH_BODY = JSON.stringify({
+  status: 'healthy',
+  service: 'expropriation-platform',
+});
+
+const HEALTH_HEADERS = {
+  'Content-Type': 'application/json',
+  'Cache-Control': 'no-store',
+};
+
+export const dynamic = 'force-dynamic';
+
+export async function GET() {
+  return new NextResponse(HEALTH_BODY, { status: 200, headers: HEALTH_HEADERS });
+}
@@ -19,11 +19,6 @@ export async function GET(
     const [meeting, agendaItem] = await Promise.all([
       prisma.meeting.findUnique({
         where: { id: (await params).id },
-        include: {
-          organizer: { select: { id: true } },
-          chair: { select: { id: true } },
-          department: { select: { id: true } },
-        },
       }),
       prisma.meetingAgendaItem.findUnique({
         where: { id: (await params).itemId },
@@ -182,18 +177,9 @@ export async function PUT(
     const [meeting, agendaItem] = await Promise.all([
       prisma.meeting.findUnique({
         where: { id: (await params).id },
-        include: {
-          organizer: { select: { id: true } },
-          chair: { select: { id: true } },
-          scheduledStart: true,
-        },
       }),
       prisma.meetingAgendaItem.findUnique({
         where: { id: (await params).itemId },
-        include: {
-          presenter: { select: { id: true } },
-          owner: { select: { id: true } },
-        },
       }),
     ]);
 
@@ -356,11 +342,6 @@ export async function DELETE(
     const [meeting, agendaItem] = await Promise.all([
       prisma.meeting.findUnique({
         where: { id: (await params).id },
-        include: {
-          organizer: { select: { id: true } },
-          chair: { select: { id: true } },
-          scheduledStart: true,
-        },
       }),
       prisma.meetingAgendaItem.findUnique({
         where: { id: (await params).itemId },
@@ -446,12 +427,12 @@ function checkMeetingAccess(meeting: any, user: any): boolean {
   }
 
   // Organizer and chair have access
-  if (meeting.organizer.id === user.id || meeting.chair.id === user.id) {
+  if (meeting.organizerId === user.id || meeting.chairId === user.id) {
     return true;
   }
 
   // Department members have access to department meetings
-  if (meeting.department.id === user.departmentId && !meeting.isPrivate) {
+  if (meeting.departmentId === user.departmentId && !meeting.isPrivate) {
     return true;
   }
 
@@ -467,12 +448,12 @@ function checkEditAgendaItemPermission(meeting: any, agendaItem: any, user: any)
   }
 
   // Organizer can edit any agenda item
-  if (meeting.organizer.id === user.id) {
+  if (meeting.organizerId === user.id) {
     return true;
   }
 
   // Chair can edit any agenda item
-  if (meeting.chair.id === user.id) {
+  if (meeting.chairId === user.id) {
     return true;
   }
 
@@ -503,12 +484,12 @@ function checkDeleteAgendaItemPermission(meeting: any, agendaItem: any, user: an
   }
 
   // Organizer can delete any agenda item
-  if (meeting.organizer.id === user.id) {
+  if (meeting.organizerId === user.id) {
     return true;
   }
 
   // Chair can delete any agenda item
-  if (meeting.chair.id === user.id) {
+  if (meeting.chairId === user.id) {
     return true;
   }
 
@@ -558,11 +539,11 @@ async function reorderAfterDeletion(meetingId: string, deletedSequence: number):
 }
 
 async function validatePresenterAccess(meeting: any, presenterId: string): Promise<boolean> {
-  if (meeting.organizer.id === presenterId || meeting.chair.id === presenterId) {
+  if (meeting.organizerId === presenterId || meeting.chairId === presenterId) {
     return true;
   }
 
-  const isParticipant = meeting.participants.some(
+  const isParticipant = meeting.participants?.some(
     (p: any) => p.userId === presenterId
   );
 
@@ -572,7 +553,7 @@ async function validatePresenterAccess(meeting: any, presenterId: string): Promi
 
   const presenter = await prisma.user.findUnique({
     where: { id: presenterId },
-    include: { role: true },
+    select: { role: { select: { name: true } } },
   });
 
   if (!presenter) {
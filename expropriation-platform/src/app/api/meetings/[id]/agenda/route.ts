@@ -4,6 +4,9 @@ import { authOptions } from "@/lib/auth";
 import { prisma } from "@/lib/prisma";
 import { z } from "zod";
 
+// Roles whose access checks always succeed; checked before any DB lookup
+const MEETING_ADMIN_ROLES = new Set(["SUPER_ADMIN", "DEPARTMENT_ADMIN"]);
+
 // GET /api/meetings/[id]/agenda - Get meeting agenda items
 export async function GET(
   request: NextRequest,
@@ -16,31 +19,32 @@ export async function GET(
     }
 
     // Verify meeting exists and user has access
+    // Scalar FKs (organizerId, chairId) are enough for the access check,
+    // so no relations need to be joined here
     const meeting = await prisma.meeting.findUnique({
       where: { id: (await params).id },
-      include: {
-        organizer: { select: { id: true } },
-        chair: { select: { id: true } },
-        department: { select: { id: true } },
-      },
     });
 
     if (!meeting) {
       return NextResponse.json({ error: "Meeting not found" }, { status: 404 });
     }
 
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true, department: true },
-    });
+    // Privileged roles always pass the access check, so skip the user
+    // lookup entirely for them and only hit the database for everyone else
+    if (!MEETING_ADMIN_ROLES.has(session.user.role.toUpperCase())) {
+      const user = await prisma.user.findUnique({
+        where: { id: session.user.id },
+        select: { id: true, departmentId: true, role: { select: { name: true } } },
+      });
 
-    if (!user) {
-      return NextResponse.json({ error: "User not found" }, { status: 404 });
-    }
+      if (!user) {
+        return NextResponse.json({ error: "User not found" }, { status: 404 });
+      }
 
-    const hasAccess = checkMeetingAccess(meeting, user);
-    if (!hasAccess) {
-      return NextResponse.json({ error: "Access denied" }, { status: 403 });
+      const hasAccess = checkMeetingAccess(meeting, user);
+      if (!hasAccess) {
+        return NextResponse.json({ error: "Access denied" }, { status: 403 });
+      }
     }
 
     const agendaItems = await prisma.meetingAgendaItem.findMany({
@@ -185,8 +189,6 @@ export async function POST(
     const meeting = await prisma.meeting.findUnique({
       where: { id: (await params).id },
       include: {
-        organizer: { select: { id: true } },
-        chair: { select: { id: true } },
         participants: {
           select: { userId: true },
         },
@@ -202,18 +204,20 @@ export async function POST(
       return NextResponse.json({ error: "Meeting not found" }, { status: 404 });
     }
 
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true },
-    });
+    if (!MEETING_ADMIN_ROLES.has(session.user.role.toUpperCase())) {
+      const user = await prisma.user.findUnique({
+        where: { id: session.user.id },
+        select: { id: true, departmentId: true, role: { select: { name: true } } },
+      });
 
-    if (!user) {
-      return NextResponse.json({ error: "User not found" }, { status: 404 });
-    }
+      if (!user) {
+        return NextResponse.json({ error: "User not found" }, { status: 404 });
+      }
 
-    const canEditAgenda = checkEditAgendaPermission(meeting, user);
-    if (!canEditAgenda) {
-      return NextResponse.json({ error: "Permission denied" }, { status: 403 });
+      const canEditAgenda = checkEditAgendaPermission(meeting, user);
+      if (!canEditAgenda) {
+        return NextResponse.json({ error: "Permission denied" }, { status: 403 });
+      }
     }
 
     // Check if meeting has already started
@@ -389,13 +393,13 @@ function checkMeetingAccess(meeting: any, user: any): boolean {
     return true;
   }
 
-  // Organizer and chair have access
-  if (meeting.organizer.id === user.id || meeting.chair.id === user.id) {
+  // Organizer and chair have access (compare FK ids to avoid joining relations)
+  if (meeting.organizerId === user.id || meeting.chairId === user.id) {
     return true;
   }
 
   // Department members have access to department meetings
-  if (meeting.department.id === user.departmentId && !meeting.isPrivate) {
+  if (meeting.departmentId === user.departmentId && !meeting.isPrivate) {
     return true;
   }
 
@@ -411,12 +415,12 @@ function checkEditAgendaPermission(meeting: any, user: any): boolean {
   }
 
   // Organizer can edit agenda
-  if (meeting.organizer.id === user.id) {
+  if (meeting.organizerId === user.id) {
     return true;
   }
 
   // Chair can edit agenda
-  if (meeting.chair.id === user.id) {
+  if (meeting.chairId === user.id) {
     return true;
   }
 
@@ -430,7 +434,7 @@ function checkEditAgendaPermission(meeting: any, user: any): boolean {
 
 async function validatePresenterAccess(meeting: any, presenterId: string): Promise<boolean> {
   // Check if presenter is organizer, chair, or a participant
-  if (meeting.organizer.id === presenterId || meeting.chair.id === presenterId) {
+  if (meeting.organizerId === presenterId || meeting.chairId === presenterId) {
     return true;
   }
 
@@ -445,7 +449,7 @@ async function validatePresenterAccess(meeting: any, presenterId: string): Promi
   // Check if user exists and has appropriate role
   const presenter = await prisma.user.findUnique({
     where: { id: presenterId },
-    include: { role: true },
+    select: { role: { select: { name: true } } },
   });
 
   if (!presenter) {
@@ -71,7 +71,7 @@ export async function POST(
     const canRSVP = participant.userId === session.user.id ||
                    user.role.name === "SUPER_ADMIN" ||
                    user.role.name === "DEPARTMENT_ADMIN" ||
-                   meeting.organizer.id === session.user.id;
+                   meeting.organizerId === session.user.id;
 
     if (!canRSVP) {
       return NextResponse.json({ error: "Permission denied" }, { status: 403 });
@@ -178,7 +178,7 @@ export async function POST(
 
     const notifications = [
       {
-        recipientId: meeting.organizer.id,
+        recipientId: meeting.organizerId,
         title: `RSVP Update: ${participant.user?.firstName || participant.name} ${participant.user?.lastName || ""}`,
         message: `${participant.user?.firstName || participant.name} ${participant.user?.lastName || ""} has ${validatedData.status.toLowerCase()} your invitation to "${meeting.title}".`,
         details: baseNotificationDetails,
@@ -186,9 +186,9 @@ export async function POST(
     ];
 
     // Add chair notification if different from organizer
-    if (meeting.chair && meeting.chair.id !== meeting.organizer.id) {
+    if (meeting.chair && meeting.chairId !== meeting.organizerId) {
       notifications.push({
-        recipientId: meeting.chair.id,
+        recipientId: meeting.chairId,
         title: `RSVP Update: ${participant.user?.firstName || participant.name} ${participant.user?.lastName || ""}`,
         message: `${participant.user?.firstName || participant.name} ${participant.user?.lastName || ""} has ${validatedData.status.toLowerCase()} your invitation to "${meeting.title}".`,
         details: baseNotificationDetails,
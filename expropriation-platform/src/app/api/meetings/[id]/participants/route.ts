@@ -4,6 +4,9 @@ import { authOptions } from "@/lib/auth";
 import { prisma } from "@/lib/prisma";
 import { z } from "zod";
 
+// Roles whose access checks always succeed; checked before any DB lookup
+const MEETING_ADMIN_ROLES = new Set(["SUPER_ADMIN", "DEPARTMENT_ADMIN"]);
+
 // GET /api/meetings/[id]/participants - Get meeting participants
 export async function GET(
   request: NextRequest,
@@ -18,29 +21,28 @@ export async function GET(
     // Verify meeting exists and user has access
     const meeting = await prisma.meeting.findUnique({
       where: { id: (await params).id },
-      include: {
-        organizer: { select: { id: true } },
-        chair: { select: { id: true } },
-        department: { select: { id: true } },
-      },
     });
 
     if (!meeting) {
       return NextResponse.json({ error: "Meeting not found" }, { status: 404 });
     }
 
-    const user = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true, department: true },
-    });
+    // Privileged roles always pass the access check, so skip the user
+    // lookup entirely for them and only hit the database for everyone else
+    if (!MEETING_ADMIN_ROLES.has(session.user.role.toUpperCase())) {
+      const user = await prisma.user.findUnique({
+        where: { id: session.user.id },
+        select: { id: true, departmentId: true, role: { select: { name: true } } },
+      });
 
-    if (!user) {
-      return NextResponse.json({ error: "User not found" }, { status: 404 });
-    }
+      if (!user) {
+        return NextResponse.json({ error: "User not found" }, { status: 404 });
+      }
 
-    const hasAccess = checkMeetingAccess(meeting, user);
-    if (!hasAccess) {
-      return NextResponse.json({ error: "Access denied" }, { status: 403 });
+      const hasAccess = checkMeetingAccess(meeting, user);
+      if (!hasAccess) {
+        return NextResponse.json({ error: "Access denied" }, { status: 403 });
+      }
     }
 
     const participants = await prisma.meetingParticipant.findMany({
@@ -135,9 +137,6 @@ export async function POST(
     const meeting = await prisma.meeting.findUnique({
       where: { id: (await params).id },
       include: {
-        organizer: { select: { id: true } },
-        chair: { select: { id: true } },
-        department: { select: { id: true } },
         _count: { select: { participants: true } },
       },
     });
@@ -182,6 +181,7 @@ export async function POST(
               ...(participantData.email ? [{ email: participantData.email }] : []),
             ],
           },
+          select: { id: true },
         });
 
         if (existingParticipant) {
@@ -322,12 +322,12 @@ function checkMeetingAccess(meeting: any, user: any): boolean {
   }
 
   // Organizer and chair have access
-  if (meeting.organizer.id === user.id || meeting.chair.id === user.id) {
+  if (meeting.organizerId === user.id || meeting.chairId === user.id) {
     return true;
   }
 
   // Department members have access to department meetings
-  if (meeting.department.id === user.departmentId && !meeting.isPrivate) {
+  if (meeting.departmentId === user.departmentId && !meeting.isPrivate) {
     return true;
   }
 
@@ -343,12 +343,12 @@ function checkManageParticipantsPermission(meeting: any, user: any): boolean {
   }
 
   // Organizer can manage participants
-  if (meeting.organizer.id === user.id) {
+  if (meeting.organizerId === user.id) {
     return true;
   }
 
   // Chair can manage participants
-  if (meeting.chair.id === user.id) {
+  if (meeting.chairId === user.id) {
     return true;
   }
 
@@ -131,32 +131,19 @@ export async function DELETE(
 
     const notificationId = (await params).id;
 
-    // Get user
-    const user = await prisma.user.findUnique({
-      where: { email: session.user?.email as string }
-    });
-
-    if (!user) {
-      return NextResponse.json({ error: 'User not found' }, { status: 404 });
-    }
-
-    // Get notification
-    const notification = await prisma.stageNotification.findFirst({
+    // Delete in a single statement; the recipient filter scopes the
+    // delete to the caller and the count doubles as the existence check
+    const deleted = await prisma.stageNotification.deleteMany({
       where: {
         id: notificationId,
-        recipientId: user.id
+        recipientId: session.user.id
       }
     });
 
-    if (!notification) {
+    if (deleted.count === 0) {
       return NextResponse.json({ error: 'Notification not found' }, { status: 404 });
     }
 
-    // Delete notification
-    await prisma.stageNotification.delete({
-      where: { id: notificationId }
-    });
-
     return NextResponse.json({
       success: true,
       message: 'Notification deleted successfully'
@@ -21,38 +21,29 @@ export async function POST(request: NextRequest) {
     // Validate request body
     const validatedData = bulkActionSchema.parse(body);
 
-    // Get user
+    // Get user. Only the id is used below, so skip the rest of the row
     const user = await prisma.user.findUnique({
-      where: { email: session.user?.email as string }
+      where: { email: session.user?.email as string },
+      select: { id: true }
     });
 
     if (!user) {
       return NextResponse.json({ error: 'User not found' }, { status: 404 });
     }
 
-    // Verify all notifications belong to the user
-    const notifications = await prisma.stageNotification.findMany({
-      where: {
-        id: { in: validatedData.notificationIds },
-        recipientId: user.id
-      }
-    });
-
-    if (notifications.length === 0) {
-      return NextResponse.json({ error: 'No valid notifications found' }, { status: 404 });
-    }
+    // Perform bulk action. Ownership is enforced by the recipientId
+    // predicate on the write itself, and the write already reports how
+    // many rows it touched, so there is no separate validation SELECT
+    const bulkWhere = {
+      id: { in: validatedData.notificationIds },
+      recipientId: user.id
+    };
 
-    const validNotificationIds = notifications.map(n => n.id);
-
-    // Perform bulk action
     let result;
     switch (validatedData.action) {
       case 'mark_read':
         result = await prisma.stageNotification.updateMany({
-          where: {
-            id: { in: validNotificationIds },
-            recipientId: user.id
-          },
+          where: bulkWhere,
           data: {
             isRead: true,
             readAt: new Date()
@@ -62,10 +53,7 @@ export async function POST(request: NextRequest) {
 
       case 'mark_unread':
         result = await prisma.stageNotification.updateMany({
-          where: {
-            id: { in: validNotificationIds },
-            recipientId: user.id
-          },
+          where: bulkWhere,
           data: {
             isRead: false,
             readAt: null
@@ -75,10 +63,7 @@ export async function POST(request: NextRequest) {
 
       case 'delete':
         result = await prisma.stageNotification.deleteMany({
-          where: {
-            id: { in: validNotificationIds },
-            recipientId: user.id
-          }
+          where: bulkWhere
         });
         break;
 
@@ -86,6 +71,10 @@ export async function POST(request: NextRequest) {
         return NextResponse.json({ error: 'Invalid action' }, { status: 400 });
     }
 
+    if (result.count === 0) {
+      return NextResponse.json({ error: 'No valid notifications found' }, { status: 404 });
+    }
+
     // Log activity
     await prisma.activity.create({
       data: {
@@ -97,7 +86,7 @@ export async function POST(request: NextRequest) {
         metadata: {
           action: validatedData.action,
           count: result.count,
-          notificationIds: validNotificationIds
+          notificationIds: validatedData.notificationIds
         }
       }
     });
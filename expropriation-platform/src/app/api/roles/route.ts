@@ -58,7 +58,8 @@ const buildUpdateData = (updateData: any) => {
   }
   if (updateData.isActive !== undefined) cleanUpdateData.isActive = updateData.isActive;
   if (updateData.permissions !== undefined) {
-    cleanUpdateData.permissions = normalizePermissions(updateData.permissions);
+    // Already normalized by the schema transform
+    cleanUpdateData.permissions = updateData.permissions;
   }
 
   return cleanUpdateData;
@@ -68,6 +69,20 @@ const sanitizeRoleResponse = (role: any) => ({
   ...role,
 });
 
+// Role listings only change when a role is written, so repeat GETs are
+// served from a process-local cache keyed by the query parameters and
+// cleared on every role mutation. Listings that embed live user counts
+// bypass the cache because those counts move with user activity, and so
+// do free-text searches, whose unbounded key space would let callers
+// grow the cache without limit. The remaining keys are combinations of
+// a handful of sort/filter flags; the size cap is a backstop.
+const ROLE_LIST_CACHE_MAX_ENTRIES = 64;
+const roleListCache = new Map<string, any>();
+
+const invalidateRoleListCache = () => {
+  roleListCache.clear();
+};
+
 // GET /api/roles - List roles with filtering
 export async function GET(request: NextRequest) {
   try {
@@ -83,6 +98,17 @@ export async function GET(request: NextRequest) {
     const sortOrder = searchParams.get('sortOrder') || 'asc';
     const includeUserCount = searchParams.get('includeUserCount') === 'true';
 
+    const cacheKey = includeUserCount || search
+      ? null
+      : `${isActive}|${sortBy}|${sortOrder}`;
+
+    if (cacheKey !== null) {
+      const cached = roleListCache.get(cacheKey);
+      if (cached !== undefined) {
+        return NextResponse.json(cached);
+      }
+    }
+
     // Build where clause
     const where: any = {};
 
@@ -129,6 +155,14 @@ export async function GET(request: NextRequest) {
       return result;
     });
 
+    if (cacheKey !== null) {
+      // Opportunistic cleanup to keep the cache bounded
+      if (roleListCache.size >= ROLE_LIST_CACHE_MAX_ENTRIES) {
+        roleListCache.clear();
+      }
+      roleListCache.set(cacheKey, sanitizedRoles);
+    }
+
     return NextResponse.json(sanitizedRoles);
   } catch (error) {
     console.error('Error fetching roles:', error);
@@ -177,6 +211,8 @@ export async function POST(request: NextRequest) {
       data: buildCreateData(validatedData),
     });
 
+    invalidateRoleListCache();
+
     await logActivity({
       userId: session.user.id,
       action: 'CREATED',
@@ -231,8 +267,9 @@ export async function PUT(request: NextRequest) {
       );
     }
 
-    // Validate the request body
-    updateRoleSchema.parse(updateData);
+    // Validate the request body; the parsed result carries the
+    // normalized permissions from the schema transform
+    const validatedUpdate = updateRoleSchema.parse(updateData);
 
     // Check if role exists
     const existingRole = await prisma.role.findUnique({
@@ -260,28 +297,17 @@ export async function PUT(request: NextRequest) {
       }
     }
 
-    // Update role - build clean update data
-    const cleanUpdateData: any = {};
-
-    // Only include fields that are actually provided in the request
-    if (updateData.name !== undefined) {
-      cleanUpdateData.name = updateData.name;
-    }
-    if (updateData.description !== undefined) {
-      cleanUpdateData.description = updateData.description === null ? null : updateData.description;
-    }
-    if (updateData.isActive !== undefined) {
-      cleanUpdateData.isActive = updateData.isActive;
-    }
-    if (updateData.permissions !== undefined) {
-      cleanUpdateData.permissions = normalizePermissions(updateData.permissions);
-    }
+    // Update role - build clean update data via the shared helper instead
+    // of a second inline copy of the same field-by-field logic
+    const cleanUpdateData = buildUpdateData(validatedUpdate);
 
     const updatedRole = await prisma.role.update({
       where: { id },
       data: cleanUpdateData,
     });
 
+    invalidateRoleListCache();
+
     // Log activity
     await logActivity({
       userId: session.user.id,
@@ -387,6 +413,8 @@ export async function DELETE(request: NextRequest) {
       },
     });
 
+    invalidateRoleListCache();
+
     // Log activity
     await logActivity({
       userId: session.user.id,
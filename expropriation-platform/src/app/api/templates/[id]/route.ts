@@ -175,6 +175,7 @@ export async function PUT(
           name: validatedData.name,
           id: { not: id },
         },
+        select: { id: true },
       });
 
       if (conflictingTemplate) {
@@ -173,6 +173,7 @@ export async function POST(request: NextRequest) {
     // Check if template name already exists
     const existingTemplate = await prisma.documentTemplate.findFirst({
       where: { name: validatedData.name },
+      select: { id: true },
     });
 
     if (existingTemplate) {
@@ -2,6 +2,9 @@ import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
+import { requireAnyPermission } from '@/lib/permissions';
+
+const canAdministerUsers = requireAnyPermission('MANAGE_USERS', 'SYSTEM_CONFIG');
 
 // GET /api/users/[id]/activity - Get user activity history
 export async function GET(
@@ -25,13 +28,7 @@ export async function GET(
 
     // Check if user has permission to view activity
     if (id !== session.user.id) {
-      const currentUser = await prisma.user.findUnique({
-        where: { id: session.user.id },
-        include: { role: true },
-      });
-
-      const userPermissions = currentUser?.role?.permissions as any;
-      if (!userPermissions?.MANAGE_USERS && !userPermissions?.SYSTEM_CONFIG) {
+      if (!(await canAdministerUsers(session.user.id))) {
         return NextResponse.json(
           { error: 'No tienes permisos para ver el historial de actividad de este usuario' },
           { status: 403 }
@@ -77,16 +74,25 @@ export async function GET(
     const total = await prisma.activity.count({ where });
 
     // Get activities
+    // Audit listings can span thousands of rows, so select only the
+    // columns the response uses and join the case in the same query
     const activities = await prisma.activity.findMany({
       where,
       orderBy: { createdAt: 'desc' },
       skip: (page - 1) * limit,
       take: limit,
-      include: {
+      select: {
+        id: true,
+        action: true,
+        entityType: true,
+        entityId: true,
+        description: true,
+        metadata: true,
+        createdAt: true,
         case: {
           select: {
             id: true,
-            caseNumber: true,
+            fileNumber: true,
             title: true,
           },
         },
@@ -102,7 +108,13 @@ export async function GET(
       description: activity.description,
       metadata: activity.metadata,
       createdAt: activity.createdAt,
-      case: activity.case,
+      case: activity.case
+        ? {
+            id: activity.case.id,
+            caseNumber: activity.case.fileNumber,
+            title: activity.case.title,
+          }
+        : null,
     }));
 
     // Get activity statistics
@@ -3,6 +3,9 @@ import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
 import { logActivity } from '@/lib/activity-logger';
+import { requireAnyPermission } from '@/lib/permissions';
+
+const canAdministerUsers = requireAnyPermission('MANAGE_USERS', 'SYSTEM_CONFIG');
 
 // DELETE /api/users/[id]/departments/[assignmentId] - Remove department assignment
 export async function DELETE(
@@ -18,13 +21,7 @@ export async function DELETE(
     const { id, assignmentId } = await params;
 
     // Check permissions
-    const currentUser = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true },
-    });
-
-    const userPermissions = currentUser?.role?.permissions as any;
-    if (!userPermissions?.MANAGE_USERS && !userPermissions?.SYSTEM_CONFIG) {
+    if (!(await canAdministerUsers(session.user.id))) {
       return NextResponse.json(
         { error: 'No tienes permisos para remover asignaciones' },
         { status: 403 }
@@ -71,6 +68,7 @@ export async function DELETE(
       const remainingAssignment = await prisma.userDepartmentAssignment.findFirst({
         where: { userId: id },
         orderBy: { assignedAt: 'asc' },
+        select: { id: true },
       });
 
       if (remainingAssignment) {
@@ -121,13 +119,7 @@ export async function PUT(
     const { id, assignmentId } = await params;
 
     // Check permissions
-    const currentUser = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true },
-    });
-
-    const userPermissions = currentUser?.role?.permissions as any;
-    if (!userPermissions?.MANAGE_USERS && !userPermissions?.SYSTEM_CONFIG) {
+    if (!(await canAdministerUsers(session.user.id))) {
       return NextResponse.json(
         { error: 'No tienes permisos para cambiar asignaciones principales' },
         { status: 403 }
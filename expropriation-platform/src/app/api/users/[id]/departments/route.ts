@@ -3,6 +3,9 @@ import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
 import { logActivity } from '@/lib/activity-logger';
+import { requireAnyPermission } from '@/lib/permissions';
+
+const canAdministerUsers = requireAnyPermission('MANAGE_USERS', 'SYSTEM_CONFIG');
 
 // GET /api/users/[id]/departments - Get user department assignments
 export async function GET(
@@ -19,13 +22,7 @@ export async function GET(
 
     // Check permissions
     if (id !== session.user.id) {
-      const currentUser = await prisma.user.findUnique({
-        where: { id: session.user.id },
-        include: { role: true },
-      });
-
-      const userPermissions = currentUser?.role?.permissions as any;
-      if (!userPermissions?.MANAGE_USERS && !userPermissions?.SYSTEM_CONFIG) {
+      if (!(await canAdministerUsers(session.user.id))) {
         return NextResponse.json(
           { error: 'No tienes permisos para ver las asignaciones de este usuario' },
           { status: 403 }
@@ -79,13 +76,7 @@ export async function POST(
     }
 
     // Check permissions
-    const currentUser = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true },
-    });
-
-    const userPermissions = currentUser?.role?.permissions as any;
-    if (!userPermissions?.MANAGE_USERS && !userPermissions?.SYSTEM_CONFIG) {
+    if (!(await canAdministerUsers(session.user.id))) {
       return NextResponse.json(
         { error: 'No tienes permisos para asignar departamentos' },
         { status: 403 }
@@ -5,6 +5,9 @@ import { prisma } from '@/lib/prisma';
 import { z } from 'zod';
 import bcrypt from 'bcryptjs';
 import { logActivity } from '@/lib/activity-logger';
+import { requireAnyPermission } from '@/lib/permissions';
+
+const canAdministerUsers = requireAnyPermission('MANAGE_USERS', 'SYSTEM_CONFIG');
 
 // Schema for password change
 const changePasswordSchema = z.object({
@@ -50,13 +53,7 @@ export async function PUT(
       validatedData = resetPasswordSchema.parse(body);
 
       // Check if user has permission to reset passwords
-      const currentUser = await prisma.user.findUnique({
-        where: { id: session.user.id },
-        include: { role: true },
-      });
-
-      const userPermissions = currentUser?.role?.permissions as any;
-      if (!userPermissions?.MANAGE_USERS && !userPermissions?.SYSTEM_CONFIG) {
+      if (!(await canAdministerUsers(session.user.id))) {
         return NextResponse.json(
           { error: 'No tienes permisos para resetear contraseñas' },
           { status: 403 }
@@ -5,6 +5,7 @@ import { prisma } from '@/lib/prisma';
 import { z } from 'zod';
 import bcrypt from 'bcryptjs';
 import { logActivity } from '@/lib/activity-logger';
+import { softDeleteUser, userDetailInclude } from '@/lib/user-query';
 
 // Schema for user updates
 const updateUserSchema = z.object({
@@ -48,36 +49,7 @@ export async function GET(
 
     const user = await prisma.user.findUnique({
       where: { id },
-      include: {
-        department: {
-          select: { id: true, name: true, code: true },
-        },
-        role: {
-          select: { id: true, name: true, description: true },
-        },
-        departmentAssignments: {
-          include: {
-            department: {
-              select: { id: true, name: true, code: true },
-            },
-          },
-        },
-        sessions: {
-          where: { isActive: true },
-          orderBy: { lastAccessAt: 'desc' },
-          take: 5,
-        },
-        _count: {
-          select: {
-            createdCases: true,
-            assignedCases: true,
-            supervisedCases: true,
-            activities: true,
-            documents: true,
-            sessions: true,
-          },
-        },
-      },
+      include: userDetailInclude,
     });
 
     if (!user) {
@@ -112,7 +84,6 @@ export async function PUT(
       return NextResponse.json({ error: 'No autorizado' }, { status: 401 });
     }
 
-    const { id } = await params;
     const body = await request.json();
     const validatedData = updateUserSchema.parse(body);
 
@@ -146,6 +117,8 @@ export async function PUT(
             },
           ],
         },
+        // Existence probe only; no columns are read from the match
+        select: { id: true },
       });
 
       if (duplicateUser) {
@@ -280,11 +253,11 @@ export async function DELETE(
       return NextResponse.json({ error: 'No autorizado' }, { status: 401 });
     }
 
-    const { id } = await params;
-
-    // Check if user exists
+    // Check if user exists; only the fields the soft delete and its log
+    // entry read
     const user = await prisma.user.findUnique({
       where: { id },
+      select: { id: true, email: true, username: true, firstName: true, lastName: true },
     });
 
     if (!user) {
@@ -303,16 +276,7 @@ export async function DELETE(
     }
 
     // Soft delete user
-    await prisma.user.update({
-      where: { id },
-      data: {
-        deletedAt: new Date(),
-        deletedBy: session.user.id,
-        isActive: false,
-        email: `deleted_${Date.now()}_${user.email}`,
-        username: `deleted_${Date.now()}_${user.username}`,
-      },
-    });
+    await softDeleteUser(user, session.user.id);
 
     // Deactivate all sessions
     await prisma.userSession.updateMany({
@@ -3,6 +3,10 @@ import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
 import { logActivity } from '@/lib/activity-logger';
+import { requireAnyPermission } from '@/lib/permissions';
+import { revokeSessionToken, revokeSessionTokens } from '@/lib/session-revocation';
+
+const canAdministerUsers = requireAnyPermission('MANAGE_USERS', 'SYSTEM_CONFIG');
 
 // GET /api/users/[id]/sessions - Get user sessions
 export async function GET(
@@ -21,13 +25,7 @@ export async function GET(
 
     // Check if user has permission to view sessions
     if (id !== session.user.id) {
-      const currentUser = await prisma.user.findUnique({
-        where: { id: session.user.id },
-        include: { role: true },
-      });
-
-      const userPermissions = currentUser?.role?.permissions as any;
-      if (!userPermissions?.MANAGE_USERS && !userPermissions?.SYSTEM_CONFIG) {
+      if (!(await canAdministerUsers(session.user.id))) {
         return NextResponse.json(
           { error: 'No tienes permisos para ver las sesiones de este usuario' },
           { status: 403 }
@@ -89,13 +87,7 @@ export async function DELETE(
 
     // Check if user has permission to terminate sessions
     if (id !== session.user.id) {
-      const currentUser = await prisma.user.findUnique({
-        where: { id: session.user.id },
-        include: { role: true },
-      });
-
-      const userPermissions = currentUser?.role?.permissions as any;
-      if (!userPermissions?.MANAGE_USERS && !userPermissions?.SYSTEM_CONFIG) {
+      if (!(await canAdministerUsers(session.user.id))) {
         return NextResponse.json(
           { error: 'No tienes permisos para terminar las sesiones de este usuario' },
           { status: 403 }
@@ -123,6 +115,9 @@ export async function DELETE(
         data: { isActive: false },
       });
 
+      // Revocation checks hit the in-memory list instead of the table
+      revokeSessionToken(targetSession.sessionToken);
+
       result = { message: 'Sesión terminada correctamente', terminatedSessions: 1 };
     } else {
       // Terminate all or all except current session
@@ -132,11 +127,18 @@ export async function DELETE(
         whereClause.sessionToken = { not: session.sessionToken };
       }
 
+      const terminatedSessions = await prisma.userSession.findMany({
+        where: whereClause,
+        select: { sessionToken: true },
+      });
+
       const terminatedCount = await prisma.userSession.updateMany({
         where: whereClause,
         data: { isActive: false },
       });
 
+      revokeSessionTokens(terminatedSessions.map((s) => s.sessionToken));
+
       result = {
         message: exceptCurrent
           ? 'Sesiones terminadas correctamente (excepto la actual)'
@@ -5,6 +5,11 @@ import { prisma } from '@/lib/prisma';
 import { z } from 'zod';
 import { logActivity } from '@/lib/activity-logger';
 import bcrypt from 'bcryptjs';
+import { requireAnyPermission } from '@/lib/permissions';
+import { revokeSessionTokens } from '@/lib/session-revocation';
+import { softDeleteUser } from '@/lib/user-query';
+
+const canAdministerUsers = requireAnyPermission('MANAGE_USERS', 'SYSTEM_CONFIG');
 
 // Schema for bulk operations
 const bulkOperationSchema = z.object({
@@ -37,13 +42,7 @@ export async function POST(request: NextRequest) {
     }
 
     // Check permissions
-    const currentUser = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true },
-    });
-
-    const userPermissions = currentUser?.role?.permissions as any;
-    if (!userPermissions?.MANAGE_USERS && !userPermissions?.SYSTEM_CONFIG) {
+    if (!(await canAdministerUsers(session.user.id))) {
       return NextResponse.json(
         { error: 'No tienes permisos para realizar operaciones masivas' },
         { status: 403 }
@@ -53,12 +52,17 @@ export async function POST(request: NextRequest) {
     const body = await request.json();
     const { userIds, operation, data } = bulkOperationSchema.parse(body);
 
-    // Validate users exist
+    // Validate users exist. Only the columns the operations and the
+    // audit summary actually touch are fetched; the joined department
+    // and role names were never read
     const users = await prisma.user.findMany({
       where: { id: { in: userIds } },
-      include: {
-        department: { select: { name: true } },
-        role: { select: { name: true } },
+      select: {
+        id: true,
+        email: true,
+        username: true,
+        firstName: true,
+        lastName: true,
       },
     });
 
@@ -138,19 +142,9 @@ export async function POST(request: NextRequest) {
 
       case 'DELETE':
         // Soft delete
-        const deletePromises = userIds.map(async (userId) => {
-          const user = users.find(u => u.id === userId);
-          return prisma.user.update({
-            where: { id: userId },
-            data: {
-              deletedAt: operationStartTime,
-              deletedBy: selfUserId,
-              isActive: false,
-              email: `deleted_${Date.now()}_${user?.email}`,
-              username: `deleted_${Date.now()}_${user?.username}`,
-            },
-          });
-        });
+        const deletePromises = users.map((user) =>
+          softDeleteUser(user, selfUserId, operationStartTime)
+        );
         result = { count: (await Promise.all(deletePromises)).length };
         break;
 
@@ -205,29 +199,28 @@ export async function POST(request: NextRequest) {
           data: { departmentId: data.departmentId },
         });
 
-        // Update department assignments
-        await Promise.all(userIds.map(async (userId) => {
-          // Deactivate existing primary assignment
-          await prisma.userDepartmentAssignment.updateMany({
+        // Update department assignments: demote every existing primary
+        // assignment and insert the new ones in two statements instead
+        // of two round trips per user
+        await prisma.$transaction([
+          prisma.userDepartmentAssignment.updateMany({
             where: {
-              userId,
+              userId: { in: userIds },
               isPrimary: true,
             },
             data: {
               isPrimary: false,
             },
-          });
-
-          // Create new primary assignment
-          await prisma.userDepartmentAssignment.create({
-            data: {
+          }),
+          prisma.userDepartmentAssignment.createMany({
+            data: userIds.map((userId) => ({
               userId,
               departmentId: data.departmentId!,
               isPrimary: true,
               assignedBy: selfUserId,
-            },
-          });
-        }));
+            })),
+          }),
+        ]);
         break;
 
       case 'RESET_PASSWORD':
@@ -247,16 +240,21 @@ export async function POST(request: NextRequest) {
             },
           });
 
-          // Deactivate all sessions
-          await prisma.userSession.updateMany({
-            where: { userId: user.id },
-            data: { isActive: false },
-          });
-
           return { userId: user.id, tempPassword, email: user.email };
         });
 
         const resetResults = await Promise.all(resetPromises);
+
+        // Deactivate all affected sessions in one statement
+        const resetSessions = await prisma.userSession.findMany({
+          where: { userId: { in: userIds }, isActive: true },
+          select: { sessionToken: true },
+        });
+        await prisma.userSession.updateMany({
+          where: { userId: { in: userIds } },
+          data: { isActive: false },
+        });
+        revokeSessionTokens(resetSessions.map((s) => s.sessionToken));
         result = {
           count: resetResults.length,
           tempPasswords: resetResults,
@@ -264,10 +262,15 @@ export async function POST(request: NextRequest) {
         break;
 
       case 'FORCE_LOGOUT':
+        const loggedOutSessions = await prisma.userSession.findMany({
+          where: { userId: { in: userIds }, isActive: true },
+          select: { sessionToken: true },
+        });
         result = await prisma.userSession.updateMany({
           where: { userId: { in: userIds }, isActive: true },
           data: { isActive: false },
         });
+        revokeSessionTokens(loggedOutSessions.map((s) => s.sessionToken));
         break;
 
       default:
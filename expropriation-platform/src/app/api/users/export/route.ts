@@ -3,6 +3,9 @@ import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { prisma } from '@/lib/prisma';
 import { logActivity } from '@/lib/activity-logger';
+import { requireAnyPermission } from '@/lib/permissions';
+
+const canExportUsers = requireAnyPermission('EXPORT', 'MANAGE_USERS', 'SYSTEM_CONFIG');
 
 // GET /api/users/export - Export users data
 export async function GET(request: NextRequest) {
@@ -13,13 +16,7 @@ export async function GET(request: NextRequest) {
     }
 
     // Check permissions
-    const currentUser = await prisma.user.findUnique({
-      where: { id: session.user.id },
-      include: { role: true },
-    });
-
-    const userPermissions = currentUser?.role?.permissions as any;
-    if (!userPermissions?.EXPORT && !userPermissions?.MANAGE_USERS && !userPermissions?.SYSTEM_CONFIG) {
+    if (!(await canExportUsers(session.user.id))) {
       return NextResponse.json(
         { error: 'No tienes permisos para exportar usuarios' },
         { status: 403 }
@@ -61,31 +58,9 @@ export async function GET(request: NextRequest) {
       where.deletedAt = null;
     }
 
-    // Get users with relations
-    const users = await prisma.user.findMany({
-      where,
-      include: {
-        department: {
-          select: { id: true, name: true, code: true },
-        },
-        role: {
-          select: { id: true, name: true, description: true },
-        },
-        _count: {
-          select: {
-            createdCases: true,
-            assignedCases: true,
-            supervisedCases: true,
-            activities: true,
-            documents: true,
-          },
-        },
-      },
-      orderBy: { createdAt: 'desc' },
-    });
-
-    // Prepare data for export
-    const exportData = users.map((user) => {
+    // Prepare one export row; only these narrow rows accumulate for
+    // the duration of the export
+    const formatUserRow = (user: any) => {
       const row: any = {};
 
       fields.forEach((field) => {
@@ -186,7 +161,47 @@ export async function GET(request: NextRequest) {
       });
 
       return row;
-    });
+    };
+
+    // Fetch users in cursor batches so an unfiltered export holds at
+    // most one batch of full rows (with their relation joins) in
+    // memory at a time instead of the entire result set
+    const EXPORT_BATCH_SIZE = 1000;
+    const exportData: any[] = [];
+    let cursor: { id: string } | undefined;
+
+    for (;;) {
+      const batch = await prisma.user.findMany({
+        where,
+        include: {
+          department: {
+            select: { id: true, name: true, code: true },
+          },
+          role: {
+            select: { id: true, name: true, description: true },
+          },
+          _count: {
+            select: {
+              createdCases: true,
+              assignedCases: true,
+              supervisedCases: true,
+              activities: true,
+              documents: true,
+            },
+          },
+        },
+        orderBy: [{ createdAt: 'desc' }, { id: 'desc' }],
+        take: EXPORT_BATCH_SIZE,
+        ...(cursor ? { cursor, skip: 1 } : {}),
+      });
+
+      for (const user of batch) {
+        exportData.push(formatUserRow(user));
+      }
+
+      if (batch.length < EXPORT_BATCH_SIZE) break;
+      cursor = { id: batch[batch.length - 1].id };
+    }
 
     // Log export activity
     await logActivity({
@@ -197,7 +212,7 @@ export async function GET(request: NextRequest) {
       description: `Exportación de usuarios en formato ${format.toUpperCase()}`,
       metadata: {
         format,
-        recordCount: users.length,
+        recordCount: exportData.length,
         fields,
         filters: {
           departmentId,
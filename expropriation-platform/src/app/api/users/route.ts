@@ -5,6 +5,8 @@ import { prisma } from '@/lib/prisma';
 import { z } from 'zod';
 import bcrypt from 'bcryptjs';
 import { logActivity } from '@/lib/activity-logger';
+import { Prisma } from '@prisma/client';
+import { userListSelect } from '@/lib/user-query';
 
 // Schema for user creation
 const createUserSchema = z.object({
@@ -53,7 +55,7 @@ export async function GET(request: NextRequest) {
     const isActive = searchParams.get('isActive');
     const isSuspended = searchParams.get('isSuspended');
     const sortBy = searchParams.get('sortBy') || 'createdAt';
-    const sortOrder = searchParams.get('sortOrder') || 'desc';
+    const sortOrder = searchParams.get('sortOrder') === 'asc' ? 'asc' : 'desc';
     const includeDeleted = searchParams.get('includeDeleted') === 'true';
 
     // Build where clause
@@ -63,9 +65,11 @@ export async function GET(request: NextRequest) {
       where.OR = [
         { firstName: { contains: search, mode: 'insensitive' } },
         { lastName: { contains: search, mode: 'insensitive' } },
-        { email: { contains: search, mode: 'insensitive' } },
-        { username: { contains: search, mode: 'insensitive' } },
-        { phone: { contains: search, mode: 'insensitive' } },
+        // Prefix match on identifier-like fields so the unique indexes
+        // on email/username can serve the search instead of a full scan
+        { email: { startsWith: search, mode: 'insensitive' } },
+        { username: { startsWith: search, mode: 'insensitive' } },
+        { phone: { startsWith: search, mode: 'insensitive' } },
       ];
     }
 
@@ -93,40 +97,23 @@ export async function GET(request: NextRequest) {
     const total = await prisma.user.count({ where });
 
     // Get users with relations
+    // Sorting by full name is pushed to the database as an ordered pair
+    // of indexed columns instead of sorting rows in process
+    const orderBy =
+      sortBy === 'fullName'
+        ? [{ firstName: sortOrder }, { lastName: sortOrder }]
+        : { [sortBy]: sortOrder };
+
     const users = await prisma.user.findMany({
       where,
-      include: {
-        department: {
-          select: { id: true, name: true, code: true },
-        },
-        role: {
-          select: { id: true, name: true, description: true },
-        },
-        _count: {
-          select: {
-            createdCases: true,
-            assignedCases: true,
-            supervisedCases: true,
-            activities: true,
-            documents: true,
-          },
-        },
-      },
-      orderBy: { [sortBy]: sortOrder },
+      select: userListSelect,
+      orderBy,
       skip: (page - 1) * limit,
       take: limit,
     });
 
-    // Remove sensitive data
-    const sanitizedUsers = users.map((user) => ({
-      ...user,
-      passwordHash: undefined,
-      twoFactorSecret: undefined,
-      backupCodes: undefined,
-    }));
-
     return NextResponse.json({
-      users: sanitizedUsers,
+      users,
       pagination: {
         page,
         limit,
@@ -154,31 +141,20 @@ export async function POST(request: NextRequest) {
     const body = await request.json();
     const validatedData = createUserSchema.parse(body);
 
-    // Check if email or username already exists
-    const existingUser = await prisma.user.findFirst({
-      where: {
-        OR: [
-          { email: validatedData.email },
-          { username: validatedData.username },
-        ],
-      },
-    });
+    // Email/username uniqueness is enforced by the database constraints;
+    // the create below surfaces a violation as P2002 instead of racing a
+    // separate pre-check query
 
-    if (existingUser) {
-      return NextResponse.json(
-        { error: 'El correo electrónico o nombre de usuario ya existe' },
-        { status: 400 }
-      );
-    }
-
-    // Validate department and role exist
-    const [department, role] = await Promise.all([
+    // Validate department and role while the password hashes; bcrypt
+    // dominates create latency, so overlap it with the lookups
+    const [department, role, passwordHash] = await Promise.all([
       prisma.department.findUnique({
         where: { id: validatedData.departmentId },
       }),
       prisma.role.findUnique({
         where: { id: validatedData.roleId },
       }),
+      bcrypt.hash(validatedData.password, 12),
     ]);
 
     if (!department) {
@@ -195,25 +171,36 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // Hash password
-    const passwordHash = await bcrypt.hash(validatedData.password, 12);
-
     // Create user
     const { password, ...userData } = validatedData;
-    const user = await prisma.user.create({
-      data: {
-        ...userData,
-        passwordHash,
-      },
-      include: {
-        department: {
-          select: { id: true, name: true, code: true },
+    let user;
+    try {
+      user = await prisma.user.create({
+        data: {
+          ...userData,
+          passwordHash,
         },
-        role: {
-          select: { id: true, name: true, description: true },
+        include: {
+          department: {
+            select: { id: true, name: true, code: true },
+          },
+          role: {
+            select: { id: true, name: true, description: true },
+          },
         },
-      },
-    });
+      });
+    } catch (error) {
+      if (
+        error instanceof Prisma.PrismaClientKnownRequestError &&
+        error.code === 'P2002'
+      ) {
+        return NextResponse.json(
+          { error: 'El correo electrónico o nombre de usuario ya existe' },
+          { status: 400 }
+        );
+      }
+      throw error;
+    }
 
     // Create primary department assignment
     await prisma.userDepartmentAssignment.create({
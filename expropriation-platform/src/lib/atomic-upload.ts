@@ -2,6 +2,7 @@ import * as fs from 'fs/promises';
 import * as path from 'path';
 import * as crypto from 'crypto';
 import { validateFileSecurity, generateSecureFileName, validateFilePath } from './file-security';
+import { hashBuffer, hashFile } from './file-hash';
 
 // Upload configuration
 const UPLOAD_TEMP_DIR = path.join(process.cwd(), 'uploads', 'temp');
@@ -119,11 +120,10 @@ async function createDateDirectory(): Promise<string> {
 }
 
 /**
- * Calculate file hash
+ * Calculate file hash (streamed; see lib/file-hash.ts)
  */
-async function calculateFileHash(filePath: string): Promise<string> {
-  const fileBuffer = await fs.readFile(filePath);
-  return crypto.createHash('sha256').update(fileBuffer).digest('hex');
+function calculateFileHash(filePath: string): Promise<string> {
+  return hashFile(filePath);
 }
 
 /**
@@ -208,8 +208,9 @@ export async function atomicFileUpload(
       }
     }
 
-    // Calculate file hash
-    const fileHash = await calculateFileHash(tempFilePath);
+    // Hash the buffer already in memory instead of re-reading the temp
+    // file that was just written
+    const fileHash = hashBuffer(fileBuffer);
 
     // Generate final file name and path
     const secureFileName = generateSecureFileName(options.originalFileName);
@@ -313,6 +314,9 @@ export async function atomicFileUpload(
 /**
  * Upload multiple files atomically with transaction-like behavior
  */
+// How many files of a bulk upload are written and hashed at once
+const UPLOAD_CONCURRENCY = 4;
+
 export async function atomicMultipleFileUpload(
   files: Array<{ buffer: Buffer; options: AtomicUploadOptions }>
 ): Promise<{
@@ -326,13 +330,32 @@ export async function atomicMultipleFileUpload(
   let totalSize = 0;
 
   try {
-    // Upload all files
-    for (const { buffer, options } of files) {
-      const result = await atomicFileUpload(buffer, options);
-      results.push(result);
-      totalSize += result.fileSize;
+    // Upload in small parallel batches so the write+hash work of
+    // independent files overlaps instead of running strictly one after
+    // another; order of results still matches the input order and any
+    // failure rolls back everything uploaded so far
+    for (let i = 0; i < files.length; i += UPLOAD_CONCURRENCY) {
+      const batch = files.slice(i, i + UPLOAD_CONCURRENCY);
+      const batchResults = await Promise.all(
+        batch.map(({ buffer, options }) => atomicFileUpload(buffer, options))
+      );
+
+      let failedIndex = -1;
+      batchResults.forEach((result, j) => {
+        results.push(result);
+        totalSize += result.fileSize;
+
+        if (!result.success && failedIndex === -1) {
+          failedIndex = j;
+        } else if (result.success && result.finalFilePath && result.fileName) {
+          uploadedFiles.push({
+            fileName: result.fileName,
+            filePath: result.finalFilePath,
+          });
+        }
+      });
 
-      if (!result.success) {
+      if (failedIndex !== -1) {
         // If any file fails, cleanup all uploaded files
         for (const uploadedFile of uploadedFiles) {
           try {
@@ -342,20 +365,14 @@ export async function atomicMultipleFileUpload(
           }
         }
 
+        const failed = batch[failedIndex];
         return {
           success: false,
           results,
           totalSize,
-          error: `Upload failed for file ${options.originalFileName}: ${result.error}`,
+          error: `Upload failed for file ${failed.options.originalFileName}: ${batchResults[failedIndex].error}`,
         };
       }
-
-      if (result.finalFilePath && result.fileName) {
-        uploadedFiles.push({
-          fileName: result.fileName,
-          filePath: result.finalFilePath,
-        });
-      }
     }
 
     return {
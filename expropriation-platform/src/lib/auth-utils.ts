@@ -91,6 +91,7 @@ export async function verifyPasswordResetToken(token: string): Promise<boolean>
       },
       isActive: true,
     },
+    select: { id: true },
   });
 
   return !!user;
@@ -108,6 +109,7 @@ export async function resetPassword(token: string, newPassword: string): Promise
       },
       isActive: true,
     },
+    select: { id: true },
   });
 
   if (!user) {
@@ -7,6 +7,12 @@ import { z } from 'zod';
 import { logUserLogin, logFailedLogin } from '@/lib/activity-logger';
 import { loggers } from '@/lib/logger';
 import { randomBytes } from 'crypto';
+import { appConfig } from '@/lib/config';
+import { isSessionRevoked } from '@/lib/session-revocation';
+
+// Parsed once from the environment (SESSION_MAX_AGE_HOURS, default 24)
+// and shared by the NextAuth config and the userSession record below
+const SESSION_MAX_AGE_SECONDS = appConfig.sessionMaxAgeSeconds;
 
 // Validate required environment variables
 if (!process.env.NEXTAUTH_SECRET) {
@@ -190,7 +196,7 @@ export const authOptions: NextAuthOptions = {
               userAgent,
               timestamp: new Date().toISOString(),
             }),
-            expiresAt: new Date(Date.now() + 24 * 60 * 60 * 1000), // 24 hours
+            expiresAt: new Date(Date.now() + SESSION_MAX_AGE_SECONDS * 1000),
           },
         });
 
@@ -225,11 +231,11 @@ export const authOptions: NextAuthOptions = {
   ],
   session: {
     strategy: 'jwt',
-    maxAge: 24 * 60 * 60, // 24 hours
+    maxAge: SESSION_MAX_AGE_SECONDS,
     updateAge: 60 * 60, // Update session every hour
   },
   jwt: {
-    maxAge: 24 * 60 * 60, // 24 hours
+    maxAge: SESSION_MAX_AGE_SECONDS,
   },
   callbacks: {
     async jwt({ token, user, trigger, session }) {
@@ -269,6 +275,14 @@ export const authOptions: NextAuthOptions = {
       return token;
     },
     async session({ session, token }) {
+      // Sessions terminated through the session management endpoints are
+      // rejected here, before any user data is attached, so a revoked
+      // JWT stops working immediately instead of surviving until it
+      // expires. The in-memory list is checked first; the userSession
+      // table remains the durable record
+      if (isSessionRevoked(token?.sessionToken as string | undefined)) {
+        return null as unknown as typeof session;
+      }
       if (token && session.user) {
         session.user.id = token.id as string;
         session.user.firstName = token.firstName as string;
@@ -298,9 +312,13 @@ export const authOptions: NextAuthOptions = {
   debug: process.env.NODE_ENV === 'development',
 };
 
-// Helper functions for server-side auth
+// Helper functions for server-side auth. The dynamic import is started
+// once at module load instead of per call, so resolving a session only
+// awaits an already-settled promise.
+const nextAuthServer = import('next-auth/next');
+
 export async function getServerSession() {
-  const { getServerSession } = await import('next-auth/next');
+  const { getServerSession } = await nextAuthServer;
   return getServerSession(authOptions);
 }
 
@@ -0,0 +1,38 @@
+/**
+ * One-time snapshot of the server environment.
+ *
+ * Reading process.env crosses into the runtime's environment object on
+ * every access, and the same handful of variables were being re-read and
+ * re-parsed across modules (and in some cases per call). The values are
+ * captured and parsed once here at module load; everything derived from
+ * the environment should come from this object so defaults live in a
+ * single place.
+ *
+ * Server-side only: client components keep their inlined
+ * process.env.NODE_ENV checks, which Next.js replaces at build time.
+ */
+
+const nodeEnv = process.env.NODE_ENV || 'development';
+
+export const appConfig = Object.freeze({
+  environment: nodeEnv,
+  isProduction: nodeEnv === 'production',
+  isDevelopment: nodeEnv === 'development',
+  appVersion: process.env.npm_package_version || '1.0.0',
+  // Session and JWT lifetime, shared by NextAuth config, the userSession
+  // expiry written at login, and the in-memory revocation list
+  sessionMaxAgeSeconds:
+    parseInt(process.env.SESSION_MAX_AGE_HOURS || '24', 10) * 60 * 60,
+  logLevel: process.env.LOG_LEVEL || (nodeEnv === 'production' ? 'info' : 'debug'),
+  smtp: Object.freeze({
+    host: process.env.SMTP_HOST || 'localhost',
+    port: parseInt(process.env.SMTP_PORT || '587', 10),
+    secure: process.env.SMTP_SECURE === 'true',
+    user: process.env.SMTP_USER || '',
+    pass: process.env.SMTP_PASS || '',
+    fromName: process.env.SMTP_FROM_NAME || 'Sistema MOPC',
+    fromEmail: process.env.SMTP_FROM_EMAIL || 'noreply@mopc.gov.do',
+  }),
+});
+
+export const { isProduction, isDevelopment } = appConfig;
@@ -8,31 +8,36 @@ export function generateNonce(): string {
   return btoa(String.fromCharCode(...randomValues));
 }
 
-// Generate CSP header with nonce
-export function generateCSPHeader(nonce: string): string {
-  const isDevelopment = process.env.NODE_ENV === 'development';
+const isDevelopment = process.env.NODE_ENV === 'development';
+
+// The environment never changes at runtime, so the directive list is
+// resolved and joined once at module load with a placeholder where the
+// per-request nonce goes.
+const NONCE_PLACEHOLDER = '__CSP_NONCE__';
 
-  const cspDirectives = [
-    "default-src 'self'",
-    // In development, allow unsafe-eval for Next.js HMR
-    isDevelopment
-      ? `script-src 'self' 'nonce-${nonce}' 'unsafe-eval' 'unsafe-inline'`
-      : `script-src 'self' 'nonce-${nonce}'`,
-    `style-src 'self' 'nonce-${nonce}' ${isDevelopment ? "'unsafe-inline'" : ''}`,
-    "img-src 'self' data: https:",
-    "font-src 'self'",
-    // Allow WebSocket connections in development for HMR
-    isDevelopment
-      ? "connect-src 'self' ws: wss:"
-      : "connect-src 'self'",
-    "frame-ancestors 'none'",
-    "base-uri 'self'",
-    "form-action 'self'",
-    // Only upgrade in production
-    ...(isDevelopment ? [] : ["upgrade-insecure-requests"]),
-  ];
+const CSP_TEMPLATE = [
+  "default-src 'self'",
+  // In development, allow unsafe-eval for Next.js HMR
+  isDevelopment
+    ? `script-src 'self' 'nonce-${NONCE_PLACEHOLDER}' 'unsafe-eval' 'unsafe-inline'`
+    : `script-src 'self' 'nonce-${NONCE_PLACEHOLDER}'`,
+  `style-src 'self' 'nonce-${NONCE_PLACEHOLDER}' ${isDevelopment ? "'unsafe-inline'" : ''}`,
+  "img-src 'self' data: https:",
+  "font-src 'self'",
+  // Allow WebSocket connections in development for HMR
+  isDevelopment
+    ? "connect-src 'self' ws: wss:"
+    : "connect-src 'self'",
+  "frame-ancestors 'none'",
+  "base-uri 'self'",
+  "form-action 'self'",
+  // Only upgrade in production
+  ...(isDevelopment ? [] : ["upgrade-insecure-requests"]),
+].join('; ');
 
-  return cspDirectives.join('; ');
+// Generate CSP header with nonce
+export function generateCSPHeader(nonce: string): string {
+  return CSP_TEMPLATE.split(NONCE_PLACEHOLDER).join(nonce);
 }
 
 // Security headers configuration
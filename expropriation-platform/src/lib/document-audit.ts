@@ -0,0 +1,117 @@
+import { prisma } from '@/lib/prisma';
+import { Prisma } from '@prisma/client';
+
+/**
+ * Batched writer for document access auditing.
+ *
+ * Download, preview and view endpoints used to INSERT their
+ * DocumentAction / DocumentHistory rows synchronously, adding a DB
+ * round trip to every user-visible action. Entries are buffered in
+ * process and flushed with createMany once the buffer fills or the
+ * flush interval elapses; if the buffer saturates the enqueue flushes
+ * inline so audit rows are never dropped under pressure.
+ */
+
+const FLUSH_BATCH_SIZE = 100;
+const FLUSH_INTERVAL_MS = 2000;
+const MAX_BUFFERED_ENTRIES = 10_000;
+
+type ActionEntry = Prisma.DocumentActionCreateManyInput;
+type HistoryEntry = Prisma.DocumentHistoryCreateManyInput;
+
+let actionBuffer: ActionEntry[] = [];
+let historyBuffer: HistoryEntry[] = [];
+let flushTimer: NodeJS.Timeout | null = null;
+let flushing: Promise<void> | null = null;
+
+async function flushBuffers(): Promise<void> {
+  if (flushing) {
+    return flushing;
+  }
+  if (actionBuffer.length === 0 && historyBuffer.length === 0) {
+    return;
+  }
+
+  const actions = actionBuffer;
+  const history = historyBuffer;
+  actionBuffer = [];
+  historyBuffer = [];
+
+  flushing = (async () => {
+    try {
+      const writes = [];
+      if (actions.length > 0) {
+        writes.push(prisma.documentAction.createMany({ data: actions }));
+      }
+      if (history.length > 0) {
+        writes.push(prisma.documentHistory.createMany({ data: history }));
+      }
+      await prisma.$transaction(writes);
+    } catch (error) {
+      console.error('Error flushing document audit buffer:', error);
+    } finally {
+      flushing = null;
+      // Entries enqueued while this flush was in flight were refused by
+      // the in-flight guard above; re-schedule them so a burst followed
+      // by quiet traffic cannot strand audit rows in memory
+      if (actionBuffer.length > 0 || historyBuffer.length > 0) {
+        scheduleFlush();
+      }
+    }
+  })();
+
+  return flushing;
+}
+
+function scheduleFlush(): Promise<void> | void {
+  const buffered = actionBuffer.length + historyBuffer.length;
+
+  // Back-pressure: a saturated buffer flushes on the caller's request
+  // instead of growing without bound
+  if (buffered >= MAX_BUFFERED_ENTRIES) {
+    return flushBuffers();
+  }
+
+  if (buffered >= FLUSH_BATCH_SIZE) {
+    void flushBuffers();
+    return;
+  }
+
+  if (!flushTimer) {
+    flushTimer = setTimeout(() => {
+      flushTimer = null;
+      void flushBuffers();
+    }, FLUSH_INTERVAL_MS);
+    // Do not keep the process alive just for pending audit rows
+    flushTimer.unref?.();
+  }
+}
+
+/**
+ * Queue a DocumentAction row for batched insertion. createdAt is
+ * stamped at enqueue time so deferred flushes keep the true order.
+ */
+export function enqueueDocumentAction(entry: ActionEntry): void {
+  actionBuffer.push({ createdAt: new Date(), ...entry });
+  void scheduleFlush();
+}
+
+/**
+ * Queue a DocumentHistory row for batched insertion.
+ */
+export function enqueueDocumentHistory(entry: HistoryEntry): void {
+  historyBuffer.push({ createdAt: new Date(), ...entry });
+  void scheduleFlush();
+}
+
+/**
+ * Drain any buffered entries immediately. Intended for tests and
+ * graceful shutdown hooks.
+ */
+export function flushDocumentAudit(): Promise<void> {
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+  return flushBuffers();
+}
@@ -73,4 +73,16 @@ export const getDocumentStatusTranslation = (status: DocumentStatus): string =>
 
 export const getDocumentSecurityLevelTranslation = (level: DocumentSecurityLevel): string => {
   return documentSecurityLevelTranslations[level] || level.replace(/_/g, ' ').replace(/\b\w/g, (l) => l.toUpperCase());
-};
\ No newline at end of file
+};
+// Stored document filePaths are relative to the app root; the root is
+// resolved once here since process.cwd() is a syscall and the document
+// routes were calling it per request (and per file in bulk paths)
+export const APP_ROOT = process.cwd();
+
+// Tags arrive as a comma-separated string from forms; the same
+// split/trim/filter chain was previously inlined at every call site
+export const parseTagList = (tags: string): string[] =>
+  tags
+    .split(',')
+    .map((tag) => tag.trim())
+    .filter(Boolean);
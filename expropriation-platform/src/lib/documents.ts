@@ -1,9 +1,12 @@
 import { prisma } from './prisma';
+import { hasDepartmentAccess } from './permissions';
 import { DocumentType, DocumentCategory, DocumentStatus, DocumentSecurityLevel } from '@prisma/client';
 import crypto from 'crypto';
+import { hashBuffer } from './file-hash';
 import path from 'path';
 import fs from 'fs/promises';
 import { DocumentFormData } from '@/types/client';
+import { parseTagList } from './document-constants';
 
 // File upload configuration
 export const MAX_FILE_SIZE = 100 * 1024 * 1024; // 100MB
@@ -49,13 +52,22 @@ export const STAGE_DOCUMENT_TYPES = {
   'CIERRE': ['REPORT', 'ADMINISTRATIVE', 'LEGAL'],
 };
 
-// Ensure upload directory exists
-async function ensureUploadDir() {
-  try {
-    await fs.access(UPLOAD_DIR);
-  } catch {
-    await fs.mkdir(UPLOAD_DIR, { recursive: true });
+// Directories survive for the life of the process, so remember which
+// ones were already created and skip the repeat stat/mkdir syscalls on
+// every subsequent upload
+const ensuredDirs = new Set<string>();
+
+async function ensureDir(dir: string): Promise<void> {
+  if (ensuredDirs.has(dir)) {
+    return;
   }
+  await fs.mkdir(dir, { recursive: true });
+  ensuredDirs.add(dir);
+}
+
+// Ensure upload directory exists
+function ensureUploadDir() {
+  return ensureDir(UPLOAD_DIR);
 }
 
 // Generate unique file path
@@ -67,12 +79,6 @@ function generateFilePath(originalName: string): string {
   return `${timestamp}-${random}-${name}${ext}`;
 }
 
-// Calculate file hash
-async function calculateFileHash(filePath: string): Promise<string> {
-  const fileBuffer = await fs.readFile(filePath);
-  return crypto.createHash('sha256').update(fileBuffer).digest('hex');
-}
-
 // Create directory for date-based organization
 async function createDateDirectory(): Promise<string> {
   const now = new Date();
@@ -81,17 +87,17 @@ async function createDateDirectory(): Promise<string> {
   const day = String(now.getDate()).padStart(2, '0');
 
   const dateDir = path.join(UPLOAD_DIR, String(year), month, day);
-  await fs.mkdir(dateDir, { recursive: true });
+  await ensureDir(dateDir);
 
   return dateDir;
 }
 
-// Extract text content for indexing (simplified version)
-async function extractTextContent(filePath: string, mimeType: string): Promise<string> {
+// Extract text content for indexing (simplified version). Works on the
+// upload buffer already in memory rather than re-reading the stored file
+async function extractTextContent(buffer: Buffer, mimeType: string): Promise<string> {
   try {
     switch (mimeType) {
       case 'text/plain':
-        const buffer = await fs.readFile(filePath);
         return buffer.toString('utf-8');
 
       case 'application/pdf':
@@ -142,11 +148,12 @@ export async function createDocumentWithFile({
   const buffer = Buffer.from(await file.arrayBuffer());
   await fs.writeFile(filePath, buffer);
 
-  // Calculate file hash
-  const fileHash = await calculateFileHash(filePath);
+  // Hash the bytes already in memory instead of re-reading the file
+  // that was just written
+  const fileHash = hashBuffer(buffer);
 
   // Extract text content for indexing
-  const contentText = await extractTextContent(filePath, file.type);
+  const contentText = await extractTextContent(buffer, file.type);
 
   // Create document record
   const document = await prisma.document.create({
@@ -216,13 +223,11 @@ export async function createDocumentWithFile({
 
   // Create tags if provided
   if (documentData.tags) {
-    const tags = documentData.tags.split(',').map(tag => tag.trim()).filter(Boolean);
-    for (const tag of tags) {
-      await prisma.documentTag.create({
-        data: {
-          documentId: document.id,
-          tag,
-        },
+    const tags = parseTagList(documentData.tags);
+    if (tags.length > 0) {
+      // Single INSERT instead of one round-trip per tag
+      await prisma.documentTag.createMany({
+        data: tags.map(tag => ({ documentId: document.id, tag })),
       });
     }
   }
@@ -284,7 +289,27 @@ export async function getDocumentById(documentId: string, userId: string) {
     throw new Error('Document not found');
   }
 
-  // Check access permissions
+  await assertAccessAllowed(document, userId);
+
+  return document;
+}
+
+// Shared access predicate over the minimal fields the decision needs
+interface DocumentAccessFields {
+  uploadedById: string;
+  securityLevel: string;
+  case: {
+    departmentId: string;
+    createdById: string;
+    assignedToId: string | null;
+    supervisedById: string | null;
+  } | null;
+}
+
+async function assertAccessAllowed(
+  document: DocumentAccessFields,
+  userId: string
+) {
   const hasAccess =
     document.uploadedById === userId ||
     (document.case && (
@@ -297,8 +322,32 @@ export async function getDocumentById(documentId: string, userId: string) {
   if (!hasAccess && document.securityLevel !== 'PUBLIC') {
     throw new Error('Access denied');
   }
+}
 
-  return document;
+// Access check that loads only the fields the decision needs, for
+// callers that don't serialize the full document afterwards
+export async function assertDocumentAccess(documentId: string, userId: string) {
+  const document = await prisma.document.findUnique({
+    where: { id: documentId },
+    select: {
+      uploadedById: true,
+      securityLevel: true,
+      case: {
+        select: {
+          departmentId: true,
+          createdById: true,
+          assignedToId: true,
+          supervisedById: true,
+        },
+      },
+    },
+  });
+
+  if (!document) {
+    throw new Error('Document not found');
+  }
+
+  await assertAccessAllowed(document, userId);
 }
 
 // Update document
@@ -307,8 +356,8 @@ export async function updateDocument(
   userId: string,
   updateData: Partial<DocumentFormData>
 ) {
-  // Check permissions first
-  await getDocumentById(documentId, userId);
+  // Check permissions first (narrow fetch; the update below returns the row)
+  await assertDocumentAccess(documentId, userId);
 
   const document = await prisma.document.update({
     where: { id: documentId },
@@ -395,7 +444,7 @@ export async function deleteDocument(documentId: string, userId: string) {
 
 // Get document versions
 export async function getDocumentVersions(documentId: string, userId: string) {
-  await getDocumentById(documentId, userId); // Check access
+  await assertDocumentAccess(documentId, userId); // Check access
 
   const versions = await prisma.documentVersion.findMany({
     where: { documentId },
@@ -422,27 +471,6 @@ export async function getDocumentVersions(documentId: string, userId: string) {
   }));
 }
 
-// Helper functions
-async function hasDepartmentAccess(userId: string, departmentId: string): Promise<boolean> {
-  const user = await prisma.user.findUnique({
-    where: { id: userId },
-    select: {
-      departmentId: true,
-      role: {
-        select: { name: true }
-      }
-    },
-  });
-
-  if (!user) return false;
-
-  const sameDepartment = user.departmentId === departmentId;
-  const hasAdminAccess = user.role?.name === 'super_admin' ||
-                        user.role?.name === 'department_admin';
-
-  return sameDepartment || hasAdminAccess;
-}
-
 export function formatFileSize(bytes: number): string {
   if (bytes === 0) return '0 Bytes';
   const k = 1024;
@@ -475,11 +503,7 @@ export async function createDocumentVersion({
   const UPLOAD_DIR = path.join(process.cwd(), 'uploads', 'documents', 'versions');
 
   // Ensure upload directory exists
-  try {
-    await fs.access(UPLOAD_DIR);
-  } catch {
-    await fs.mkdir(UPLOAD_DIR, { recursive: true });
-  }
+  await ensureDir(UPLOAD_DIR);
 
   // Generate unique file path
   const timestamp = Date.now();
@@ -494,7 +518,7 @@ export async function createDocumentVersion({
   await fs.writeFile(filePath, buffer);
 
   // Calculate file hash
-  const fileHash = crypto.createHash('sha256').update(buffer).digest('hex');
+  const fileHash = hashBuffer(buffer);
 
   // Create document version record
   const version = await prisma.documentVersion.create({
@@ -1,5 +1,6 @@
 import { prisma } from './prisma';
 import nodemailer from 'nodemailer';
+import { appConfig } from './config';
 
 export interface EmailConfig {
   host: string;
@@ -38,9 +39,18 @@ class EmailQueueProcessor {
   private isProcessing = false;
   private processingInterval: NodeJS.Timeout | null = null;
   private config: EmailConfig | null = null;
-
-  constructor() {
-    this.initialize();
+  private initPromise: Promise<void> | null = null;
+
+  // Initialization probes the SMTP config (possibly from the database),
+  // builds a transporter, verifies it over the network, and starts the
+  // processing interval. That work is deferred until the first email is
+  // queued so importing this module has no side effects and processes
+  // that never send mail skip the transport setup entirely.
+  private ensureInitialized(): Promise<void> {
+    if (!this.initPromise) {
+      this.initPromise = this.initialize();
+    }
+    return this.initPromise;
   }
 
   private async initialize(): Promise<void> {
@@ -78,18 +88,19 @@ class EmailQueueProcessor {
 
   private async loadEmailConfig(): Promise<EmailConfig | null> {
     try {
-      // Try to load from environment variables first
+      // Try to load from the environment snapshot first
+      const { smtp } = appConfig;
       const envConfig: EmailConfig = {
-        host: process.env.SMTP_HOST || 'localhost',
-        port: parseInt(process.env.SMTP_PORT || '587'),
-        secure: process.env.SMTP_SECURE === 'true',
+        host: smtp.host,
+        port: smtp.port,
+        secure: smtp.secure,
         auth: {
-          user: process.env.SMTP_USER || '',
-          pass: process.env.SMTP_PASS || ''
+          user: smtp.user,
+          pass: smtp.pass
         },
         from: {
-          name: process.env.SMTP_FROM_NAME || 'Sistema MOPC',
-          email: process.env.SMTP_FROM_EMAIL || 'noreply@mopc.gov.do'
+          name: smtp.fromName,
+          email: smtp.fromEmail
         }
       };
 
@@ -339,6 +350,9 @@ class EmailQueueProcessor {
     correlationId?: string;
     batchId?: string;
   }): Promise<string> {
+    // Kick off transport setup without delaying the enqueue itself
+    void this.ensureInitialized();
+
     try {
       const emailQueue = await prisma.emailQueue.create({
         data: {
@@ -458,6 +472,8 @@ class EmailQueueProcessor {
   }
 
   public async retryFailedEmails(hoursBack: number = 24): Promise<number> {
+    void this.ensureInitialized();
+
     try {
       const cutoffTime = new Date(Date.now() - hoursBack * 60 * 60 * 1000);
 
@@ -0,0 +1,63 @@
+import { createHash } from 'crypto';
+import { createReadStream, createWriteStream } from 'fs';
+import { Readable, Transform } from 'stream';
+import { pipeline } from 'stream/promises';
+import type { ReadableStream as WebReadableStream } from 'stream/web';
+
+/**
+ * Streaming file hashing shared by the upload paths.
+ *
+ * The previous per-module helpers read the entire file into a Buffer
+ * before hashing, so a large upload held its full size in memory and the
+ * hash could not start until the last byte was read. Streaming in 1 MiB
+ * chunks keeps memory flat, overlaps disk reads with hashing, and Node's
+ * OpenSSL-backed crypto picks the hardware SHA extensions on its own.
+ */
+
+const HASH_CHUNK_BYTES = 1024 * 1024;
+
+export function hashBuffer(buffer: Buffer, algorithm = 'sha256'): string {
+  return createHash(algorithm).update(buffer).digest('hex');
+}
+
+export function hashFile(filePath: string, algorithm = 'sha256'): Promise<string> {
+  return new Promise((resolve, reject) => {
+    const hash = createHash(algorithm);
+    const stream = createReadStream(filePath, { highWaterMark: HASH_CHUNK_BYTES });
+
+    stream.on('error', reject);
+    stream.on('data', (chunk) => hash.update(chunk));
+    stream.on('end', () => resolve(hash.digest('hex')));
+  });
+}
+
+/**
+ * Stream an uploaded file to disk while hashing it in the same pass.
+ *
+ * Upload handlers that buffer the whole file, write it, then hash the
+ * buffer hold the full upload in memory and read every byte twice.
+ * Piping the request body through the hasher into the write stream
+ * keeps memory flat and produces the digest the moment the last chunk
+ * lands on disk.
+ */
+export async function hashStreamToFile(
+  source: ReadableStream<Uint8Array>,
+  destPath: string,
+  algorithm = 'sha256'
+): Promise<string> {
+  const hash = createHash(algorithm);
+  const tap = new Transform({
+    transform(chunk, _encoding, callback) {
+      hash.update(chunk);
+      callback(null, chunk);
+    },
+  });
+
+  await pipeline(
+    Readable.fromWeb(source as unknown as WebReadableStream),
+    tap,
+    createWriteStream(destPath, { highWaterMark: HASH_CHUNK_BYTES })
+  );
+
+  return hash.digest('hex');
+}
@@ -70,11 +70,11 @@ export const FILE_SIGNATURES = {
 };
 
 // Dangerous file extensions to block
-export const DANGEROUS_EXTENSIONS = [
+export const DANGEROUS_EXTENSIONS = new Set([
   '.exe', '.bat', '.cmd', '.com', '.pif', '.scr', '.vbs', '.js', '.jar',
   '.ps1', '.sh', '.php', '.asp', '.aspx', '.jsp', '.py', '.rb', '.pl',
   '.msi', '.deb', '.rpm', '.dmg', '.app', '.pkg', '.iso', '.img',
-];
+]);
 
 // Maximum file size for different types (in bytes)
 export const FILE_SIZE_LIMITS = {
@@ -170,7 +170,7 @@ export async function detectFileType(filePath: string): Promise<string[]> {
  */
 export function isDangerousExtension(fileName: string): boolean {
   const ext = path.extname(fileName).toLowerCase();
-  return DANGEROUS_EXTENSIONS.includes(ext);
+  return DANGEROUS_EXTENSIONS.has(ext);
 }
 
 /**
@@ -1,5 +1,6 @@
 import winston from 'winston';
 import path from 'path';
+import { appConfig } from '@/lib/config';
 
 // Define log levels with custom colors
 const logLevels = {
@@ -18,31 +19,37 @@ const logColors = {
   debug: 'white',
 };
 
-winston.addColors(logColors);
+// Determine if we're in production
+const isProduction = appConfig.isProduction;
 
-// Custom format for development
-const developmentFormat = winston.format.combine(
-  winston.format.timestamp({ format: 'YYYY-MM-DD HH:mm:ss:ms' }),
-  winston.format.colorize({ all: true }),
-  winston.format.printf(
-    (info) => `${info.timestamp} ${info.level}: ${info.message}` +
-    (info.splat !== undefined ? `${info.splat}` : " ") +
-    (info.stack !== undefined ? `${info.stack}` : " ") +
-    (info.metadata !== undefined && info.metadata !== null && Object.keys(info.metadata).length > 0
-      ? `\n${JSON.stringify(info.metadata, null, 2)}`
-      : "")
-  ),
-);
+// Only the active environment's format chain is assembled; building
+// both (and registering colors) on every process start was wasted work
+// for whichever half never runs.
+function buildDevelopmentFormat() {
+  winston.addColors(logColors);
+  return winston.format.combine(
+    winston.format.timestamp({ format: 'YYYY-MM-DD HH:mm:ss:ms' }),
+    winston.format.colorize({ all: true }),
+    winston.format.printf(
+      (info) => `${info.timestamp} ${info.level}: ${info.message}` +
+      (info.splat !== undefined ? `${info.splat}` : " ") +
+      (info.stack !== undefined ? `${info.stack}` : " ") +
+      (info.metadata !== undefined && info.metadata !== null && Object.keys(info.metadata).length > 0
+        ? `\n${JSON.stringify(info.metadata, null, 2)}`
+        : "")
+    ),
+  );
+}
 
-// Custom format for production (JSON)
-const productionFormat = winston.format.combine(
-  winston.format.timestamp(),
-  winston.format.errors({ stack: true }),
-  winston.format.json(),
-);
+function buildProductionFormat() {
+  return winston.format.combine(
+    winston.format.timestamp(),
+    winston.format.errors({ stack: true }),
+    winston.format.json(),
+  );
+}
 
-// Determine if we're in production
-const isProduction = process.env.NODE_ENV === 'production';
+const activeFormat = isProduction ? buildProductionFormat() : buildDevelopmentFormat();
 
 // Create transports array
 const transports: winston.transport[] = [];
@@ -51,35 +58,47 @@ const transports: winston.transport[] = [];
 if (!isProduction) {
   transports.push(
     new winston.transports.Console({
-      format: developmentFormat,
+      format: activeFormat,
     })
   );
 }
 
-// File transports for production
+// File transports for production. Winston file transports already
+// decouple request handlers from disk I/O by pushing records onto an
+// internal write stream, so no extra queueing layer is needed; the
+// size caps below keep each rotation a cheap rename instead of letting
+// the files grow without bound.
+const FILE_TRANSPORT_OPTIONS = {
+  maxsize: 10 * 1024 * 1024, // 10MB per file
+  maxFiles: 5,
+  tailable: true,
+} as const;
+
 if (isProduction) {
   transports.push(
     new winston.transports.File({
       filename: path.join(process.cwd(), 'logs', 'error.log'),
       level: 'error',
-      format: productionFormat,
+      format: activeFormat,
+      ...FILE_TRANSPORT_OPTIONS,
     }),
     new winston.transports.File({
       filename: path.join(process.cwd(), 'logs', 'combined.log'),
-      format: productionFormat,
+      format: activeFormat,
+      ...FILE_TRANSPORT_OPTIONS,
     })
   );
 }
 
 // Create the main logger instance
 export const logger = winston.createLogger({
-  level: process.env.LOG_LEVEL || (isProduction ? 'info' : 'debug'),
+  level: appConfig.logLevel,
   levels: logLevels,
-  format: isProduction ? productionFormat : developmentFormat,
+  format: activeFormat,
   defaultMeta: {
     service: 'expropriation-platform',
-    version: process.env.npm_package_version || '1.0.0',
-    environment: process.env.NODE_ENV || 'development',
+    version: appConfig.appVersion,
+    environment: appConfig.environment,
   },
   transports,
   exitOnError: false, // Don't exit on handled exceptions
@@ -104,7 +123,9 @@ export function createRequestLogger(
   });
 }
 
-// Helper functions for structured logging
+// Helper functions for structured logging. Timestamps come from the
+// winston.format.timestamp() stage, so the helpers do not build their
+// own Date/ISO string per record.
 export const loggers = {
   // Security events logging
   security: {
@@ -116,7 +137,6 @@ export const loggers = {
         ip,
         success,
         userId,
-        timestamp: new Date().toISOString(),
       });
     },
 
@@ -128,7 +148,6 @@ export const loggers = {
         requiredRole,
         userId,
         ip,
-        timestamp: new Date().toISOString(),
       });
     },
 
@@ -137,7 +156,6 @@ export const loggers = {
         type: 'security',
         event: 'suspicious_activity',
         details,
-        timestamp: new Date().toISOString(),
       });
     },
 
@@ -147,7 +165,6 @@ export const loggers = {
         event: 'configuration_issue',
         issue,
         details,
-        timestamp: new Date().toISOString(),
       });
     },
   },
@@ -162,7 +179,6 @@ export const loggers = {
         table,
         duration,
         error: error?.message,
-        timestamp: new Date().toISOString(),
       });
     },
 
@@ -172,7 +188,6 @@ export const loggers = {
         type: 'database',
         event: `connection_${status}`,
         error: error?.message,
-        timestamp: new Date().toISOString(),
       });
     },
   },
@@ -187,7 +202,6 @@ export const loggers = {
         url,
         userId,
         requestId,
-        timestamp: new Date().toISOString(),
       });
     },
 
@@ -201,7 +215,6 @@ export const loggers = {
         statusCode,
         duration,
         requestId,
-        timestamp: new Date().toISOString(),
       });
     },
 
@@ -214,7 +227,6 @@ export const loggers = {
         error: error.message,
         stack: error.stack,
         requestId,
-        timestamp: new Date().toISOString(),
       });
     },
   },
@@ -228,7 +240,6 @@ export const loggers = {
         caseId,
         userId,
         details,
-        timestamp: new Date().toISOString(),
       });
     },
 
@@ -240,7 +251,6 @@ export const loggers = {
         caseId,
         userId,
         filename,
-        timestamp: new Date().toISOString(),
       });
     },
 
@@ -252,7 +262,6 @@ export const loggers = {
         fromStage,
         toStage,
         userId,
-        timestamp: new Date().toISOString(),
       });
     },
   },
@@ -266,7 +275,6 @@ export const loggers = {
         query: query.substring(0, 200), // Truncate long queries
         duration,
         threshold,
-        timestamp: new Date().toISOString(),
       });
     },
 
@@ -278,7 +286,6 @@ export const loggers = {
         used,
         total,
         percentage,
-        timestamp: new Date().toISOString(),
       });
     },
   },
@@ -289,14 +296,16 @@ if (isProduction) {
   logger.exceptions.handle(
     new winston.transports.File({
       filename: path.join(process.cwd(), 'logs', 'exceptions.log'),
-      format: productionFormat,
+      format: activeFormat,
+      ...FILE_TRANSPORT_OPTIONS,
     })
   );
 
   logger.rejections.handle(
     new winston.transports.File({
       filename: path.join(process.cwd(), 'logs', 'rejections.log'),
-      format: productionFormat,
+      format: activeFormat,
+      ...FILE_TRANSPORT_OPTIONS,
     })
   );
 }
@@ -223,15 +223,20 @@ function analyzeFileEntropy(buffer: Buffer): MalwareThreat[] {
   return threats;
 }
 
+// Built once at module load so metadata scans allocate nothing per file
+const SUSPICIOUS_EXTENSIONS = new Set([
+  '.scr', '.pif', '.com', '.bat', '.cmd', '.js', '.jar', '.vbs', '.ps1',
+]);
+const SUSPICIOUS_NAMES = ['setup', 'install', 'crack', 'keygen', 'patch', 'loader', 'dropper'];
+
 // Scan for suspicious file metadata
 function scanFileMetadata(fileName: string, fileSize: number): MalwareThreat[] {
   const threats: MalwareThreat[] = [];
 
   // Check for suspicious file extensions
-  const suspiciousExtensions = ['.scr', '.pif', '.com', '.bat', '.cmd', '.js', '.jar', '.vbs', '.ps1'];
   const ext = path.extname(fileName).toLowerCase();
 
-  if (suspiciousExtensions.includes(ext)) {
+  if (SUSPICIOUS_EXTENSIONS.has(ext)) {
     threats.push({
       type: 'suspicious',
       name: 'Suspicious-Extension',
@@ -242,10 +247,9 @@ function scanFileMetadata(fileName: string, fileSize: number): MalwareThreat[] {
   }
 
   // Check for suspicious file names
-  const suspiciousNames = ['setup', 'install', 'crack', 'keygen', 'patch', 'loader', 'dropper'];
   const baseName = path.basename(fileName, ext).toLowerCase();
 
-  for (const name of suspiciousNames) {
+  for (const name of SUSPICIOUS_NAMES) {
     if (baseName.includes(name)) {
       threats.push({
         type: 'suspicious',
@@ -0,0 +1,162 @@
+import { prisma } from '@/lib/prisma';
+
+/**
+ * Cached access profile for permission checks.
+ *
+ * A single API request frequently runs several permission checks
+ * (route-level role check, per-document ownership check, department
+ * scoping), and each helper used to issue its own user/role query.
+ * Loading the profile once and caching it for a short window collapses
+ * those round-trips to a single query per request.
+ */
+export interface UserAccessProfile {
+  departmentId: string;
+  roleName: string;
+  permissions: Record<string, boolean>;
+}
+
+// Roles that bypass department scoping checks
+export const PRIVILEGED_ROLES = new Set(['super_admin', 'department_admin']);
+
+// Permission flags that also bypass department scoping; iterated as a
+// fixed tuple so the check never probes beyond these keys
+const DEPARTMENT_BYPASS_PERMISSIONS = ['admin', 'allDepartments', 'viewAllCases'] as const;
+
+// Short-lived in-memory cache (same pattern as the login rate limiter).
+// The TTL only needs to cover the lifetime of a single request so that
+// repeated checks within one request reuse the first lookup; it is kept
+// short so role/department changes take effect almost immediately.
+const ACCESS_PROFILE_TTL_MS = 5 * 1000;
+const accessProfileCache = new Map<
+  string,
+  { profile: UserAccessProfile | null; expiresAt: number }
+>();
+
+/**
+ * Load the user's department, role and permission map with a single
+ * narrow query. Results are cached briefly so multiple permission
+ * checks in the same request hit the database only once.
+ */
+export async function getUserAccessProfile(userId: string): Promise<UserAccessProfile | null> {
+  const now = Date.now();
+  const cached = accessProfileCache.get(userId);
+  if (cached && cached.expiresAt > now) {
+    return cached.profile;
+  }
+
+  const user = await prisma.user.findUnique({
+    where: { id: userId },
+    select: {
+      departmentId: true,
+      role: {
+        select: { name: true, permissions: true },
+      },
+    },
+  });
+
+  const profile: UserAccessProfile | null = user
+    ? {
+        departmentId: user.departmentId,
+        roleName: user.role?.name ?? '',
+        permissions: (user.role?.permissions as Record<string, boolean>) ?? {},
+      }
+    : null;
+
+  accessProfileCache.set(userId, { profile, expiresAt: now + ACCESS_PROFILE_TTL_MS });
+
+  // Opportunistic cleanup to keep the cache bounded
+  if (accessProfileCache.size > 1000) {
+    for (const [key, entry] of accessProfileCache) {
+      if (entry.expiresAt <= now) {
+        accessProfileCache.delete(key);
+      }
+    }
+  }
+
+  return profile;
+}
+
+/**
+ * Invalidate the cached profile after role or department changes
+ * (or the whole cache when called without arguments).
+ */
+export function clearAccessProfileCache(userId?: string): void {
+  if (userId) {
+    accessProfileCache.delete(userId);
+  } else {
+    accessProfileCache.clear();
+  }
+}
+
+/**
+ * Check if a role bypasses department scoping.
+ */
+export function isPrivilegedRole(roleName: string): boolean {
+  return PRIVILEGED_ROLES.has(roleName);
+}
+
+// Checkers are built once per flag combination and reused, so routes
+// can declare their guard at module scope instead of re-deriving the
+// permission condition on every request
+const permissionCheckers = new Map<string, (userId: string) => Promise<boolean>>();
+
+/**
+ * Build (and memoize) a checker that passes when the user's role grants
+ * any of the given permission flags. Declare the checker at module
+ * scope and call it with the session user id; the underlying profile
+ * lookup is cached per request window.
+ */
+export function requireAnyPermission(...flags: string[]): (userId: string) => Promise<boolean> {
+  const key = flags.join('|');
+  let checker = permissionCheckers.get(key);
+  if (!checker) {
+    checker = async (userId: string) => {
+      const profile = await getUserAccessProfile(userId);
+      if (!profile) return false;
+      return flags.some((flag) => profile.permissions[flag] === true);
+    };
+    permissionCheckers.set(key, checker);
+  }
+  return checker;
+}
+
+/**
+ * Visibility scope for case queries: super admins see everything,
+ * everyone else sees cases from their department or where they are a
+ * party. Returns a Prisma-compatible where fragment (or null when the
+ * user is unrestricted) so callers merge the permission algebra into
+ * the primary query instead of filtering rows in process.
+ */
+export function caseScopeForUser(
+  userId: string,
+  profile: UserAccessProfile
+): { OR: Array<Record<string, string>> } | null {
+  if (profile.roleName.toUpperCase() === 'SUPER_ADMIN') {
+    return null;
+  }
+
+  return {
+    OR: [
+      { departmentId: profile.departmentId },
+      { assignedToId: userId },
+      { supervisedById: userId },
+      { createdById: userId },
+    ],
+  };
+}
+
+/**
+ * Check if a user can access resources scoped to a department.
+ * Uses the cached access profile, so repeated checks within a
+ * request do not re-query the user.
+ */
+export async function hasDepartmentAccess(userId: string, departmentId: string): Promise<boolean> {
+  const profile = await getUserAccessProfile(userId);
+  if (!profile) return false;
+
+  return (
+    profile.departmentId === departmentId ||
+    isPrivilegedRole(profile.roleName) ||
+    DEPARTMENT_BYPASS_PERMISSIONS.some((flag) => profile.permissions[flag] === true)
+  );
+}
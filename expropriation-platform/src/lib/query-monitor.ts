@@ -1,4 +1,5 @@
 import { performance } from 'perf_hooks'
+import { isDevelopment } from '@/lib/config'
 
 interface QueryMetrics {
   query: string
@@ -13,6 +14,7 @@ class QueryPerformanceMonitor {
   private metrics: QueryMetrics[] = []
   private maxMetrics: number = 1000
   private slowQueryThreshold: number = 100 // ms
+  private queriesDisabledDepth: number = 0
 
   constructor(maxMetrics = 1000, slowQueryThreshold = 100) {
     this.maxMetrics = maxMetrics
@@ -25,6 +27,16 @@ class QueryPerformanceMonitor {
     queryFn: () => Promise<T>,
     params?: any
   ): Promise<T> {
+    // Serialization sections marked queries-disabled must not reach the
+    // database; fail loudly in development, warn in production
+    if (this.queriesDisabledDepth > 0) {
+      const message = `Query executed inside a queries-disabled section: ${queryType}`
+      if (isDevelopment) {
+        throw new Error(message)
+      }
+      console.warn(`⚠️ ${message}`)
+    }
+
     const startTime = performance.now()
     const timestamp = new Date()
 
@@ -112,6 +124,17 @@ class QueryPerformanceMonitor {
     }
   }
 
+  // Run a section with tracked queries disabled. Use around response
+  // shaping that should only touch data the primary query already loaded
+  async runWithQueriesDisabled<T>(fn: () => Promise<T> | T): Promise<T> {
+    this.queriesDisabledDepth++
+    try {
+      return await fn()
+    } finally {
+      this.queriesDisabledDepth--
+    }
+  }
+
   // Clear metrics
   clearMetrics(): void {
     this.metrics = []
@@ -154,6 +177,11 @@ class QueryPerformanceMonitor {
 // Singleton instance for global usage
 export const queryMonitor = new QueryPerformanceMonitor()
 
+// Convenience wrapper over the singleton guard
+export function queriesDisabled<T>(fn: () => Promise<T> | T): Promise<T> {
+  return queryMonitor.runWithQueriesDisabled(fn)
+}
+
 // Decorator for automatic query tracking
 export function trackQuery(queryType?: string) {
   return function (target: any, propertyName: string, descriptor: PropertyDescriptor) {
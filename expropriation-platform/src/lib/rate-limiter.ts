@@ -73,15 +73,37 @@ const rateLimitStore = new Map<string, {
   lastReset: number;
 }>();
 
-// Clean up expired entries periodically
-setInterval(() => {
-  const now = Date.now();
+// Bound the store so clients rotating identifiers cannot grow it
+// without limit between sweeps; expired entries are culled first and,
+// if the store is still full, the oldest fraction of live entries goes
+// too (Map iteration order is insertion order)
+const MAX_ENTRIES = 10000;
+const CULL_FRACTION = 10;
+
+function cullRateLimitStore(now: number): void {
   for (const [key, data] of rateLimitStore.entries()) {
     if (now > data.resetTime) {
       rateLimitStore.delete(key);
     }
   }
+
+  if (rateLimitStore.size >= MAX_ENTRIES) {
+    let toDrop = Math.ceil(rateLimitStore.size / CULL_FRACTION);
+    for (const key of rateLimitStore.keys()) {
+      if (toDrop-- <= 0) {
+        break;
+      }
+      rateLimitStore.delete(key);
+    }
+  }
+}
+
+// Clean up expired entries periodically; unref so the timer does not
+// keep the process alive on its own
+const cleanupInterval = setInterval(() => {
+  cullRateLimitStore(Date.now());
 }, 5 * 60 * 1000); // Clean up every 5 minutes
+cleanupInterval.unref?.();
 
 /**
  * Get client identifier from request
@@ -109,6 +131,9 @@ function getRateLimitEntry(clientId: string, config: RateLimitConfig) {
   let entry = rateLimitStore.get(clientId);
 
   if (!entry || now > entry.resetTime) {
+    if (!entry && rateLimitStore.size >= MAX_ENTRIES) {
+      cullRateLimitStore(now);
+    }
     entry = {
       requests: 0,
       uploads: 0,
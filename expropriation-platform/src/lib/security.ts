@@ -1,6 +1,7 @@
 import * as crypto from 'crypto';
 import * as bcrypt from 'bcryptjs';
 import { z } from 'zod';
+import { SECURITY_HEADERS } from './csp';
 
 // Security constants
 export const SECURITY_CONSTANTS = {
@@ -227,18 +228,11 @@ export const rateLimiting = {
   },
 };
 
-// Security headers (CSP is now handled in middleware with nonces)
-export const securityHeaders = {
-  'X-Frame-Options': 'DENY',
-  'X-Content-Type-Options': 'nosniff',
-  'Referrer-Policy': 'strict-origin-when-cross-origin',
-  'Permissions-Policy': 'camera=(), microphone=(), geolocation=()',
-  'X-XSS-Protection': '1; mode=block',
-  // HSTS is only added in production via middleware
-  'Strict-Transport-Security': process.env.NODE_ENV === 'production'
-    ? 'max-age=31536000; includeSubDomains; preload'
-    : undefined,
-};
+// Security headers (CSP is now handled in middleware with nonces).
+// Alias of the definition in csp.ts that the middleware sends; a second
+// copy here had already drifted from it, including an HSTS entry set to
+// undefined in development.
+export const securityHeaders = SECURITY_HEADERS;
 
 // Audit logging
 export const auditLogger = {
@@ -0,0 +1,65 @@
+/**
+ * In-memory session revocation list.
+ *
+ * Terminating a session records its token here with a TTL matching the
+ * session lifetime, so revocation checks are a Map lookup instead of a
+ * userSession query on the hot path. Entries expire on their own once the
+ * underlying session would have expired anyway, so no cleanup job is
+ * needed. The userSession table remains the durable record for audit and
+ * the session management UI.
+ */
+
+import { appConfig } from '@/lib/config';
+
+// Matches session.maxAge in auth.ts
+const SESSION_MAX_AGE_MS = appConfig.sessionMaxAgeSeconds * 1000;
+
+// Prune lazily once the list grows past this size
+const PRUNE_THRESHOLD = 1024;
+
+// sessionToken -> epoch ms after which the entry is irrelevant
+const revokedTokens = new Map<string, number>();
+
+function pruneExpired(now: number): void {
+  for (const [token, expiresAt] of revokedTokens) {
+    if (expiresAt <= now) {
+      revokedTokens.delete(token);
+    }
+  }
+}
+
+export function revokeSessionToken(sessionToken: string): void {
+  const now = Date.now();
+  if (revokedTokens.size >= PRUNE_THRESHOLD) {
+    pruneExpired(now);
+  }
+  revokedTokens.set(sessionToken, now + SESSION_MAX_AGE_MS);
+}
+
+export function revokeSessionTokens(sessionTokens: Iterable<string>): void {
+  for (const token of sessionTokens) {
+    revokeSessionToken(token);
+  }
+}
+
+export function isSessionRevoked(sessionToken?: string | null): boolean {
+  if (!sessionToken) {
+    return false;
+  }
+
+  const expiresAt = revokedTokens.get(sessionToken);
+  if (expiresAt === undefined) {
+    return false;
+  }
+
+  if (expiresAt <= Date.now()) {
+    revokedTokens.delete(sessionToken);
+    return false;
+  }
+
+  return true;
+}
+
+export function clearRevokedSessions(): void {
+  revokedTokens.clear();
+}
@@ -0,0 +1,138 @@
+import { Prisma } from '@prisma/client';
+import { prisma } from '@/lib/prisma';
+
+/**
+ * Shared eager-loading shapes for user queries.
+ *
+ * The user list and detail routes serialize the same relations
+ * (department, role with permissions, usage counters). Defining the
+ * include objects once keeps the routes consistent and guarantees that
+ * everything the response needs is loaded by the primary query instead
+ * of drifting into per-route follow-up fetches.
+ */
+
+// Scalar columns the list endpoint serializes. Secrets and password
+// reset tokens never leave the database, and dropping them up front
+// trims the widest columns from every listed row.
+export const userListSelect = {
+  id: true,
+  email: true,
+  username: true,
+  firstName: true,
+  lastName: true,
+  phone: true,
+  avatar: true,
+  isActive: true,
+  isSuspended: true,
+  suspensionReason: true,
+  suspendedAt: true,
+  suspendedBy: true,
+  lastLoginAt: true,
+  lastLoginIp: true,
+  lastLoginUserAgent: true,
+  loginCount: true,
+  failedLoginAttempts: true,
+  lockedUntil: true,
+  passwordChangedAt: true,
+  mustChangePassword: true,
+  jobTitle: true,
+  bio: true,
+  officeLocation: true,
+  workingHours: true,
+  preferredLanguage: true,
+  timezone: true,
+  twoFactorEnabled: true,
+  emailNotifications: true,
+  emailMarketing: true,
+  emailDigest: true,
+  theme: true,
+  dateRange: true,
+  dashboardConfig: true,
+  deletedAt: true,
+  deletedBy: true,
+  createdAt: true,
+  updatedAt: true,
+  departmentId: true,
+  roleId: true,
+  department: {
+    select: { id: true, name: true, code: true },
+  },
+  role: {
+    select: { id: true, name: true, description: true, permissions: true },
+  },
+  _count: {
+    select: {
+      createdCases: true,
+      assignedCases: true,
+      supervisedCases: true,
+      activities: true,
+      documents: true,
+    },
+  },
+} satisfies Prisma.UserSelect;
+
+export const userDetailInclude = {
+  department: {
+    select: { id: true, name: true, code: true },
+  },
+  role: {
+    // Include the permission map so the detail response carries
+    // the user's effective permissions without a second request
+    select: { id: true, name: true, description: true, permissions: true },
+  },
+  departmentAssignments: {
+    include: {
+      department: {
+        select: { id: true, name: true, code: true },
+      },
+    },
+  },
+  sessions: {
+    where: { isActive: true },
+    orderBy: { lastAccessAt: 'desc' },
+    take: 5,
+  },
+  _count: {
+    select: {
+      createdCases: true,
+      assignedCases: true,
+      supervisedCases: true,
+      activities: true,
+      documents: true,
+      sessions: true,
+    },
+  },
+} satisfies Prisma.UserInclude;
+
+/**
+ * Fields that must never leave the server. Spread-friendly helper for
+ * stripping them before serializing a user row.
+ */
+export function sanitizeUser<T extends Record<string, unknown>>(user: T) {
+  const { passwordHash, twoFactorSecret, backupCodes, ...sanitized } = user;
+  return sanitized;
+}
+
+/**
+ * Soft delete a user with a single targeted UPDATE of exactly the
+ * soft-delete columns. Email and username get a timestamped prefix so
+ * the unique constraints free up for reuse. Centralized here so the
+ * single and bulk delete routes issue the same minimal write instead of
+ * each maintaining its own copy.
+ */
+export function softDeleteUser(
+  user: { id: string; email: string; username: string },
+  deletedBy: string,
+  deletedAt: Date = new Date()
+) {
+  return prisma.user.update({
+    where: { id: user.id },
+    data: {
+      deletedAt,
+      deletedBy,
+      isActive: false,
+      email: `deleted_${deletedAt.getTime()}_${user.email}`,
+      username: `deleted_${deletedAt.getTime()}_${user.username}`,
+    },
+  });
+}
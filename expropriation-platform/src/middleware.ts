@@ -4,6 +4,27 @@ import type { NextRequest } from 'next/server';
 import { edgeLogger } from '@/lib/edge-logger';
 import { generateNonce, generateCSPHeader, SECURITY_HEADERS } from '@/lib/csp';
 
+// The secret cannot change while the process is running, so it is read
+// once here instead of twice per request inside the handler
+const NEXTAUTH_SECRET = process.env.NEXTAUTH_SECRET;
+
+// Role sets for route gates, built once instead of allocating an array
+// and doing a linear includes() on every request through the middleware
+const ADMIN_ROLES = new Set(['super_admin', 'department_admin']);
+const MEETING_ROLES = new Set([
+  'super_admin',
+  'department_admin',
+  'technical_meeting_coordinator',
+]);
+const VALID_ROLES = new Set([
+  'super_admin',
+  'department_admin',
+  'analyst',
+  'supervisor',
+  'observer',
+  'technical_meeting_coordinator',
+]);
+
 // Helper function to get client IP
 function getClientIP(req: NextRequest): string {
   const forwarded = req.headers.get('x-forwarded-for');
@@ -37,17 +58,7 @@ export default async function middleware(req: NextRequest) {
   // Generate a nonce for this request
   const nonce = generateNonce();
 
-  // Validate that NEXTAUTH_SECRET is set in production
-  if (process.env.NODE_ENV === 'production' && !process.env.NEXTAUTH_SECRET) {
-    edgeLogger.security.configurationIssue('NEXTAUTH_SECRET not set in production', {
-      environment: process.env.NODE_ENV,
-      url: req.url,
-      ip: getClientIP(req),
-    });
-    return new Response('Server configuration error', { status: 500 });
-  }
-
-  if (!process.env.NEXTAUTH_SECRET) {
+  if (!NEXTAUTH_SECRET) {
     edgeLogger.security.configurationIssue('NEXTAUTH_SECRET not configured', {
       environment: process.env.NODE_ENV,
       url: req.url,
@@ -58,7 +69,7 @@ export default async function middleware(req: NextRequest) {
 
   const token = await getToken({
     req,
-    secret: process.env.NEXTAUTH_SECRET
+    secret: NEXTAUTH_SECRET
   });
   const { pathname } = req.nextUrl;
 
@@ -102,8 +113,7 @@ export default async function middleware(req: NextRequest) {
   const userRole = token.role as string;
 
   // Validate user role to prevent privilege escalation
-  const validRoles = ['super_admin', 'department_admin', 'analyst', 'supervisor', 'observer', 'technical_meeting_coordinator'];
-  if (!validRoles.includes(userRole)) {
+  if (!VALID_ROLES.has(userRole)) {
     const ip = getClientIP(req);
     edgeLogger.security.suspiciousActivity('invalid_role_detected', {
       detectedRole: userRole,
@@ -133,8 +143,7 @@ export default async function middleware(req: NextRequest) {
   }
 
   // Department management routes
-  if (pathname.startsWith('/departments') &&
-      !['super_admin', 'department_admin'].includes(userRole)) {
+  if (pathname.startsWith('/departments') && !ADMIN_ROLES.has(userRole)) {
     edgeLogger.security.suspiciousActivity('unauthorized_department_access', {
       userId: token.sub || 'unknown',
       userEmail: token.email || 'unknown',
@@ -148,8 +157,7 @@ export default async function middleware(req: NextRequest) {
   }
 
   // User management routes
-  if (pathname.startsWith('/users') &&
-      !['super_admin', 'department_admin'].includes(userRole)) {
+  if (pathname.startsWith('/users') && !ADMIN_ROLES.has(userRole)) {
     edgeLogger.security.suspiciousActivity('unauthorized_user_management_access', {
       userId: token.sub || 'unknown',
       userEmail: token.email || 'unknown',
@@ -163,8 +171,7 @@ export default async function middleware(req: NextRequest) {
   }
 
   // Meeting coordination routes
-  if (pathname.startsWith('/meetings') &&
-      !['super_admin', 'department_admin', 'technical_meeting_coordinator'].includes(userRole)) {
+  if (pathname.startsWith('/meetings') && !MEETING_ROLES.has(userRole)) {
     edgeLogger.security.suspiciousActivity('unauthorized_meeting_access', {
       userId: token.sub || 'unknown',
       userEmail: token.email || 'unknown',
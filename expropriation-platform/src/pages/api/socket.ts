@@ -1,7 +1,6 @@
 import { NextApiRequest, NextApiResponse } from 'next';
 import { Server as NetServer } from 'http';
-import { Server as SocketIOServer } from 'socket.io';
-import { initializeWebSocket } from '@/lib/websocket-server';
+import { initializeWebSocket, wsServer } from '@/lib/websocket-server';
 
 export const config = {
   api: {
@@ -19,23 +18,15 @@ const SocketHandler = (req: NextApiRequest, res: NextApiResponse & { socket: any
   console.log('Initializing Socket.IO server...');
 
   const httpServer: NetServer = res.socket.server as any;
-  const io = new SocketIOServer(httpServer, {
-    path: '/api/socket/io',
-    addTrailingSlash: false,
-    cors: {
-      origin: process.env.NODE_ENV === 'production'
-        ? process.env.NEXTAUTH_URL
-        : ["http://localhost:3000"],
-      methods: ["GET", "POST"],
-      credentials: true
-    }
-  });
 
-  // Initialize our WebSocket server
+  // The notification server owns the only Socket.IO instance. A second
+  // bare instance used to be attached here as well, duplicating upgrade
+  // handlers and heartbeat timers on the same HTTP server while serving
+  // no events.
   initializeWebSocket(httpServer);
 
-  res.socket.server.io = io;
+  res.socket.server.io = wsServer;
   res.end();
 };
 
-export default SocketHandler;
\ No newline at end of file
+export default SocketHandler;
@@ -117,15 +117,19 @@ export const DEFAULT_PERMISSIONS: RolePermissions = {
   MANAGE_BACKUPS: false,
 };
 
+// Known permission keys, computed once so normalization iterates a fixed
+// list instead of probing the defaults object per input entry
+const PERMISSION_KEYS = Object.keys(DEFAULT_PERMISSIONS) as Array<keyof RolePermissions>;
+
 // Helper function to ensure all permission keys exist
 export function normalizePermissions(permissions: Partial<RolePermissions> = {}): RolePermissions {
   const result: RolePermissions = { ...DEFAULT_PERMISSIONS };
 
-  Object.entries(permissions).forEach(([key, value]) => {
-    if (key in DEFAULT_PERMISSIONS) {
-      result[key as keyof RolePermissions] = Boolean(value);
+  for (const key of PERMISSION_KEYS) {
+    if (permissions[key] !== undefined) {
+      result[key] = Boolean(permissions[key]);
     }
-  });
+  }
 
   return result;
 }
\ No newline at end of file